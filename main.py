@@ -15,15 +15,89 @@ Commands:
 
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple, Union, AsyncIterator
+
+import aiohttp
 
 from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
 from astrbot.api import logger
 import astrbot.api.message_components as Comp
 
-from .modules import Client, Video, ImageProcessor, Category, SortOrder, TimeFilter
+from .modules import Client, make_resolver, Video, ImageProcessor, TTLCache, Category, SortOrder, TimeFilter
+
+# 缩略图最长等待时间(秒), 超时则只发送文字
+THUMBNAIL_TIMEOUT = 10
+
+# 列表命令后台预取缩略图的数量 / 并发上限
+PREFETCH_COUNT = 3
+PREFETCH_CONCURRENCY = 4
+
+# 缓存整理间隔(秒)
+CACHE_GC_INTERVAL = 60
+
+# 列表命令显示的视频数量
+LIST_LIMIT = 10
+
+# 列表结果缓存: 最多条目数 / 列表有效期(秒)
+# 热门/高评分第 1 页与分类列表已由 Client 缓存, 此处不再重复缓存
+LIST_CACHE_SIZE = 64
+LIST_CACHE_TTL = 120
+
+# 预定义分类及其提示文本 (进程内不变, 导入时计算一次)
+_CATEGORIES_TUPLE: Tuple[str, ...] = Category.all()
+_CATEGORIES_HELP = ", ".join(_CATEGORIES_TUPLE)
+_CATEGORIES_USAGE_MSG = (
+    "❌ 请提供分类名称\n"
+    f"可用分类: {_CATEGORIES_HELP}\n"
+    "用法: /xxxgfporncategory <category>\u200B"
+)
+
+_CATEGORIES_FALLBACK_HINT = "\n\n💡 使用 /xxxgfporncategory <category> 查看分类视频\u200B"
+_MSG_CATEGORIES_AVAILABLE = "📁 可用分类:\u200B\n" + _CATEGORIES_HELP + _CATEGORIES_FALLBACK_HINT
+_MSG_CATEGORIES_PREDEFINED = "📁 预定义分类:\u200B\n" + _CATEGORIES_HELP + _CATEGORIES_FALLBACK_HINT
+
+# 固定回复文本 (标题已带换行, 均已附加 \u200B)
+_HDR_LATEST = "🆕 最新视频\u200B\n"
+_HDR_POPULAR = "🔥 热门视频\u200B\n"
+_HDR_TOP_RATED = "⭐ 高评分视频\u200B\n"
+_HDR_ALL_CATEGORIES = "📁 所有分类:\u200B\n"
+_MSG_NO_LATEST = "📭 暂无最新视频\u200B"
+_MSG_NO_POPULAR = "📭 暂无热门视频\u200B"
+_MSG_NO_TOP_RATED = "📭 暂无高评分视频\u200B"
+_MSG_LINK_HINT = "\n💡 点击链接访问视频\u200B"
+_MSG_CATEGORY_SLUG_HINT = "\n💡 使用 /xxxgfporncategory <slug> 查看分类视频\u200B"
+_MSG_VIDEO_USAGE = "❌ 请提供视频ID\n用法: /xxxgfporn <video_id>\u200B"
+_MSG_SEARCH_USAGE = "❌ 请提供搜索关键词\n用法: /xxxgfpornsearch <关键词>\u200B"
+_MSG_RANDOM_PREFIX = "🎲 随机视频\u200B\n"
+
+# 无参数列表命令: 命令名 -> (标题, 空结果提示, 错误提示, Client 方法名)
+_LIST_CMDS: Dict[str, Tuple[str, str, str, str]] = {
+    "xxxgfpornlatest": (_HDR_LATEST, _MSG_NO_LATEST, "获取最新视频失败", "get_latest_videos"),
+    "xxxgfpornpopular": (_HDR_POPULAR, _MSG_NO_POPULAR, "获取热门视频失败", "get_popular_videos"),
+    "xxxgfporntop": (_HDR_TOP_RATED, _MSG_NO_TOP_RATED, "获取高评分视频失败", "get_top_rated_videos"),
+}
+
+# 第 1 页由 Client 自身缓存的列表方法 (插件层不再缓存)
+_CLIENT_CACHED_LISTS = frozenset({"get_popular_videos", "get_top_rated_videos"})
+
+# 视频详情固定头部: 标题, ID, 链接
+_TPL_HEADER = "🎬 标题: %s\u200B\n🆔 ID: %s\u200B\n🔗 链接: %s\u200B"
+
+# 视频详情可选字段: (模板, 列表字段最多显示项数), 模板已含换行与 \u200B
+# 顺序与 _format_video_info 中读取的字段一一对应:
+# duration, views, rating, uploader, upload_date, categories, tags
+_FIELD_SPECS: Tuple[Tuple[str, Optional[int]], ...] = (
+    ("\n⏱ 时长: %s\u200B", None),
+    ("\n👀 观看: %s\u200B", None),
+    ("\n⭐ 评分: %s\u200B", None),
+    ("\n👤 上传者: %s\u200B", None),
+    ("\n📅 上传日期: %s\u200B", None),
+    ("\n📁 分类: %s\u200B", 5),
+    ("\n🏷 标签: %s\u200B", 8),
+)
 
 
 @register("astrbot_plugin_xxxgfporn", "vmoranv", "XXXGFPORN视频信息查询插件", "1.0.0")
@@ -35,7 +109,24 @@ class XXXGFPornPlugin(Star):
         self._client: Optional[Client] = None
         self._image_processor: Optional[ImageProcessor] = None
         self._cache_dir: Optional[Path] = None
-        self._last_cache_files: List[str] = []
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # 配置项 (initialize 时读取一次)
+        self._proxy: Optional[str] = None
+        self._mosaic_level: int = 2
+        self._request_timeout: int = 30
+        
+        self._background_tasks: Set[asyncio.Task] = set()
+        # 限制后台预取的并发下载数
+        self._prefetch_sem = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        # 缩略图打码处理线程池 (CPU 密集, 避免阻塞事件循环)
+        self._img_pool: Optional[ThreadPoolExecutor] = None
+        # 后台缓存整理任务
+        self._gc_task: Optional[asyncio.Task] = None
+        # 列表命令结果缓存, 短时间内重复请求不再抓取页面
+        self._list_cache = TTLCache(maxsize=LIST_CACHE_SIZE, ttl=LIST_CACHE_TTL)
+        # 正在进行的缩略图下载 (URL -> Future), 合并同一 URL 的并发请求
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     async def initialize(self):
         """初始化插件"""
@@ -43,300 +134,348 @@ class XXXGFPornPlugin(Star):
         config = self.context.get_config()
         plugin_config = config.get("astrbot_plugin_xxxgfporn", {})
         
-        # 代理配置
-        proxy = plugin_config.get("proxy", "")
+        # 代理配置 (空字符串视为不使用代理)
+        self._proxy = plugin_config.get("proxy") or None
         
         # 打码程度 (0=不打码, 1=轻度, 2=中度, 3=重度)
-        mosaic_level = plugin_config.get("mosaic_level", 2)
+        self._mosaic_level = int(plugin_config.get("mosaic_level", 2))
+        
+        # 请求超时(秒)
+        self._request_timeout = int(plugin_config.get("request_timeout", 30))
+        
+        # 缓存上限 (文件数量 / 总大小MB)
+        max_cache_files = int(plugin_config.get("max_cache_files", 100))
+        cache_max_mb = int(plugin_config.get("cache_max_mb", 200))
+        
+        # 共享HTTP会话 (连接池 + keep-alive, 客户端与图片下载共用)
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            # 优先使用 aiodns 异步解析 (未安装时回退到线程解析)
+            resolver=make_resolver(),
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+            trust_env=True
+        )
         
         # 初始化客户端
-        self._client = Client(proxy=proxy if proxy else None)
+        self._client = Client(
+            proxy=self._proxy,
+            timeout=self._request_timeout,
+            session=self._session
+        )
         
         # 初始化缓存目录
         data_dir = Path(os.path.dirname(__file__)) / "data"
         self._cache_dir = data_dir / "cache"
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # 初始化图片处理器
-        self._image_processor = ImageProcessor(
+        self._img_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="xxxgfporn-img")
+        
+        # 初始化图片处理器 (创建缓存目录并扫描已有缓存, 放到线程中避免阻塞事件循环)
+        self._image_processor = await asyncio.to_thread(
+            ImageProcessor,
             cache_dir=str(self._cache_dir),
-            mosaic_level=mosaic_level,
-            proxy=proxy if proxy else None
+            mosaic_level=self._mosaic_level,
+            proxy=self._proxy,
+            max_cache_files=max_cache_files,
+            max_cache_bytes=cache_max_mb * 1024 * 1024,
+            session=self._session,
+            executor=self._img_pool
         )
         
+        # 缓存整理放到后台定期执行, 不占用命令处理路径
+        self._gc_task = asyncio.create_task(self._gc_loop())
+        
         logger.info("XXXGFPORN插件初始化完成\u200B")
     
     async def terminate(self):
         """清理插件资源"""
+        # 停止缓存整理任务
+        if self._gc_task:
+            self._gc_task.cancel()
+            self._gc_task = None
+        
+        # 取消后台预取任务
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_tasks.clear()
+        
+        # 保存缓存索引, 下次启动时无需重新扫描缓存目录
+        if self._image_processor:
+            await self._image_processor.save_index()
+            await self._image_processor.close()
+        
         # 关闭客户端
         if self._client:
             await self._client.close()
         
-        # 清理缓存
-        self._cleanup_cache()
+        # 关闭共享会话
+        if self._session and not self._session.closed:
+            await self._session.close()
+        
+        # 关闭图片处理线程池
+        if self._img_pool:
+            self._img_pool.shutdown(wait=False, cancel_futures=True)
+            self._img_pool = None
         
         logger.info("XXXGFPORN插件已停止\u200B")
     
-    def _cleanup_cache(self) -> None:
-        """清理上次发送的缓存文件"""
-        for file_path in self._last_cache_files:
+    async def _gc_loop(self):
+        """定期整理缩略图缓存: 同步索引与磁盘文件并按 LRU 上限淘汰"""
+        while True:
+            await asyncio.sleep(CACHE_GC_INTERVAL)
             try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                deleted = await self._image_processor.sweep_cache()
+                if deleted:
+                    logger.debug("缓存整理删除了 %s 个文件\u200B", deleted)
             except Exception as e:
-                logger.warning(f"清理缓存文件失败: {file_path}, 错误: {e}\u200B")
-        self._last_cache_files.clear()
+                logger.warning("缓存整理失败: %s\u200B", e)
     
     def _format_video_info(self, video: Video) -> str:
         """格式化视频信息为文本"""
-        lines = []
-        lines.append(f"🎬 标题: {video.title or '未知'}\u200B")
-        lines.append(f"🆔 ID: {video.video_id}\u200B")
-        lines.append(f"🔗 链接: {video.url}\u200B")
-        
-        if video.duration:
-            lines.append(f"⏱ 时长: {video.duration}\u200B")
-        
-        if video.views:
-            lines.append(f"👀 观看: {video.views}\u200B")
-        
-        if video.rating:
-            lines.append(f"⭐ 评分: {video.rating}\u200B")
-        
-        if video.uploader:
-            lines.append(f"👤 上传者: {video.uploader}\u200B")
-        
-        if video.upload_date:
-            lines.append(f"📅 上传日期: {video.upload_date}\u200B")
-        
-        if video.categories:
-            lines.append(f"📁 分类: {', '.join(video.categories[:5])}\u200B")
-        
-        if video.tags:
-            lines.append(f"🏷 标签: {', '.join(video.tags[:8])}\u200B")
+        # 每个属性只读取一次, 之后只操作局部变量
+        title, video_id, url = video.title, video.video_id, video.url
+        values = (
+            video.duration, video.views, video.rating, video.uploader,
+            video.upload_date, video.categories, video.tags,
+        )
         
-        return "\n".join(lines)
+        return _TPL_HEADER % (title or '未知', video_id, url) + "".join(
+            template % (", ".join(value[:max_items]) if max_items else value,)
+            for value, (template, max_items) in zip(values, _FIELD_SPECS)
+            if value
+        )
     
     def _format_video_list_item(self, video_info: Dict[str, Any], index: int) -> str:
         """格式化视频列表项"""
-        title = video_info.get("title", "未知标题")
-        video_url = video_info.get("url", "")
-        duration = video_info.get("duration", "")
-        views = video_info.get("views", "")
+        duration = video_info.get("duration")
+        views = video_info.get("views")
+        video_url = video_info.get("url")
         
-        line = f"{index}. {title}\u200B"
+        parts = [f"{index}. {video_info.get('title', '未知标题')}\u200B"]
         if duration:
-            line += f" [{duration}]"
+            parts.append(f" [{duration}]")
         if views:
-            line += f" 👀{views}"
+            parts.append(f" 👀{views}")
         
         # 显示完整URL而不是ID
         if video_url:
-            line += f"\n   🔗 {video_url}\u200B"
+            parts.append(f"\n   🔗 {video_url}\u200B")
         
-        return line
+        return "".join(parts)
     
-    async def _get_and_send_thumbnail(
-        self,
-        event: AstrMessageEvent,
-        thumbnail_url: Optional[str]
-    ) -> None:
-        """获取并发送缩略图"""
+    async def _prepare_image(self, thumbnail_url: Optional[str]) -> Optional[Union[str, bytes]]:
+        """下载并处理缩略图, 缓存命中时返回本地路径, 否则直接返回图片数据"""
         if not thumbnail_url or not self._image_processor:
-            return
+            return None
         
+        # 同一 URL 已在下载中: 等待其结果而不是重复下载
+        pending = self._inflight.get(thumbnail_url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[thumbnail_url] = future
         try:
-            # 清理上次的缓存
-            self._cleanup_cache()
-            
-            # 下载并处理图片
-            image_path, from_cache = await self._image_processor.get_image(
-                thumbnail_url,
-                use_cache=True,
-                apply_mosaic=True
+            result = await self._load_image(thumbnail_url)
+            future.set_result(result)
+            return result
+        finally:
+            # 发起者被取消时也要唤醒等待者
+            if not future.done():
+                future.set_result(None)
+            self._inflight.pop(thumbnail_url, None)
+    
+    async def _load_image(self, thumbnail_url: str) -> Optional[Union[str, bytes]]:
+        """实际执行缩略图下载与处理, 失败时返回 None"""
+        try:
+            # 未命中缓存时直接返回处理后的图片数据, 缓存文件在后台写入
+            image_path, image_bytes = await asyncio.wait_for(
+                self._image_processor.get_image_data(
+                    thumbnail_url,
+                    use_cache=True,
+                    apply_mosaic=True
+                ),
+                timeout=THUMBNAIL_TIMEOUT
             )
+            logger.debug("图片处理结果: path=%s, from_cache=%s\u200B", image_path, image_path is not None)
             
             if image_path:
-                # 记录缓存文件
-                if not from_cache:
-                    self._last_cache_files.append(image_path)
-                
-                # 发送图片
-                yield event.image_result(image_path)
+                return image_path
+            if image_bytes:
+                return image_bytes
+            logger.warning("缩略图下载失败: %s\u200B", thumbnail_url)
+        except asyncio.TimeoutError:
+            logger.warning("缩略图处理超时: %s\u200B", thumbnail_url)
+        except Exception as e:
+            logger.warning("缩略图处理失败: %s\u200B", e)
+        return None
+    
+    @staticmethod
+    def _image_component(image: Union[str, bytes]) -> Comp.Image:
+        """将缓存路径或图片数据转为消息组件"""
+        if isinstance(image, bytes):
+            return Comp.Image.fromBytes(image)
+        return Comp.Image.fromFileSystem(image)
+    
+    def _prefetch_thumbnails(self, thumbnail_urls: List[Optional[str]]) -> None:
+        """在后台并发预取缩略图, 预热缓存 (不阻塞回复)"""
+        for thumbnail_url in thumbnail_urls:
+            if not thumbnail_url:
+                continue
+            task = asyncio.create_task(self._prefetch_one(thumbnail_url))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    async def _prefetch_one(self, thumbnail_url: str) -> None:
+        """预取单个缩略图, 受 PREFETCH_CONCURRENCY 限制"""
+        async with self._prefetch_sem:
+            await self._prepare_image(thumbnail_url)
+    
+    @staticmethod
+    def _arg1(message_str: str) -> Optional[str]:
+        """取命令后的第一个参数(剩余全部文本), 无参数时返回 None"""
+        parts = message_str.split(None, 1)
+        if len(parts) < 2:
+            return None
+        return parts[1].strip() or None
+    
+    @staticmethod
+    async def _take(source: AsyncIterator[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
+        """从异步迭代器中最多取 n 项后立即停止"""
+        items = []
+        if n <= 0:
+            return items
+        async for item in source:
+            items.append(item)
+            if len(items) >= n:
+                break
+        return items
+    
+    async def _render_list(
+        self,
+        event: AstrMessageEvent,
+        header: str,
+        empty_msg: str,
+        error_msg: str,
+        source: AsyncIterator[Dict[str, Any]],
+        cache_key: Optional[Tuple] = None
+    ):
+        """列表类命令的通用流程: 取前 LIST_LIMIT 个视频并格式化输出
+        
+        header 与 empty_msg 需为完整回复文本 (含 \u200B), 此处不再拼接。
+        给出 cache_key 时结果会在 LIST_CACHE_TTL 秒内复用。
+        """
+        try:
+            videos = self._list_cache.get(cache_key) if cache_key else None
+            if videos is None:
+                videos = await self._take(source, LIST_LIMIT)
+                if videos and cache_key:
+                    self._list_cache.set(cache_key, videos)
+            
+            if not videos:
+                yield event.plain_result(empty_msg)
+                return
+            
+            # 后台预取前几个视频的缩略图
+            self._prefetch_thumbnails([v.get("thumbnail") for v in videos[:PREFETCH_COUNT]])
+            
+            lines = [header]
+            for i, video_info in enumerate(videos, 1):
+                lines.append(self._format_video_list_item(video_info, i))
+            
+            lines.append(_MSG_LINK_HINT)
+            yield event.plain_result("\n".join(lines))
+        
         except Exception as e:
-            logger.warning(f"获取缩略图失败: {e}\u200B")
+            logger.error("%s: %s\u200B", error_msg, e)
+            yield event.plain_result(f"❌ {error_msg}: {str(e)}\u200B")
+    
+    async def _handle_list(self, event: AstrMessageEvent, command: str):
+        """按 _LIST_CMDS 中的配置处理无参数列表命令"""
+        header, empty_msg, error_msg, method_name = _LIST_CMDS[command]
+        source = getattr(self._client, method_name)(page=1, limit=LIST_LIMIT)
+        cache_key = None if method_name in _CLIENT_CACHED_LISTS else (method_name, 1)
+        async for result in self._render_list(
+            event, header, empty_msg, error_msg, source, cache_key=cache_key
+        ):
+            yield result
     
     @filter.command("xxxgfporn")
     async def cmd_get_video(self, event: AstrMessageEvent):
         """获取视频详情 - 用法: /xxxgfporn <video_id>"""
-        # 清理上次缓存
-        self._cleanup_cache()
-        
         # 解析参数
-        message_str = event.message_str.strip()
-        parts = message_str.split(maxsplit=1)
-        
-        if len(parts) < 2:
-            yield event.plain_result("❌ 请提供视频ID\n用法: /xxxgfporn <video_id>\u200B")
+        video_id = self._arg1(event.message_str)
+        if not video_id:
+            yield event.plain_result(_MSG_VIDEO_USAGE)
             return
         
-        video_id = parts[1].strip()
-        
         try:
             # 获取视频信息
             video = await self._client.get_video(video_id)
             
+            # 缩略图下载与文字排版并行
+            image, text = await asyncio.gather(
+                self._prepare_image(video.thumbnail),
+                asyncio.to_thread(self._format_video_info, video)
+            )
+            
             # 准备消息链 - 图片在前，文字在后
             chain = []
-            
-            # 先获取缩略图
-            if video.thumbnail:
-                try:
-                    image_path, from_cache = await self._image_processor.get_image(
-                        video.thumbnail,
-                        use_cache=True,
-                        apply_mosaic=True
-                    )
-                    if image_path:
-                        if not from_cache:
-                            self._last_cache_files.append(image_path)
-                        # 图片放在最前面
-                        chain.append(Comp.Image.fromFileSystem(image_path))
-                except Exception as img_err:
-                    logger.warning(f"缩略图处理失败: {img_err}\u200B")
-            
-            # 文字放在图片后面
-            chain.append(Comp.Plain(self._format_video_info(video)))
+            if image:
+                chain.append(self._image_component(image))
+            chain.append(Comp.Plain(text))
             
             # 发送合并的消息
             yield event.chain_result(chain)
         
         except Exception as e:
-            logger.error(f"获取视频失败: {e}\u200B")
+            logger.error("获取视频失败: %s\u200B", e)
             yield event.plain_result(f"❌ 获取视频失败: {str(e)}\u200B")
     
     @filter.command("xxxgfpornsearch")
     async def cmd_search(self, event: AstrMessageEvent):
         """搜索视频 - 用法: /xxxgfpornsearch <关键词>"""
-        self._cleanup_cache()
-        
-        message_str = event.message_str.strip()
-        parts = message_str.split(maxsplit=1)
-        
-        if len(parts) < 2:
-            yield event.plain_result("❌ 请提供搜索关键词\n用法: /xxxgfpornsearch <关键词>\u200B")
+        query = self._arg1(event.message_str)
+        if not query:
+            yield event.plain_result(_MSG_SEARCH_USAGE)
             return
         
-        query = parts[1].strip()
-        
-        try:
-            videos = []
-            async for video_info in self._client.search(query, page=1):
-                videos.append(video_info)
-                if len(videos) >= 10:
-                    break
-            
-            if not videos:
-                yield event.plain_result(f"🔍 未找到相关视频: {query}\u200B")
-                return
-            
-            lines = [f"🔍 搜索结果: {query}\u200B\n"]
-            for i, video_info in enumerate(videos, 1):
-                lines.append(self._format_video_list_item(video_info, i))
-            
-            lines.append("\n💡 点击链接访问视频\u200B")
-            yield event.plain_result("\n".join(lines))
-        
-        except Exception as e:
-            logger.error(f"搜索失败: {e}\u200B")
-            yield event.plain_result(f"❌ 搜索失败: {str(e)}\u200B")
+        async for result in self._render_list(
+            event,
+            f"🔍 搜索结果: {query}\u200B\n",
+            f"🔍 未找到相关视频: {query}\u200B",
+            "搜索失败",
+            self._client.search(query, page=1, limit=LIST_LIMIT),
+            cache_key=("search", query, 1)
+        ):
+            yield result
     
     @filter.command("xxxgfpornlatest")
     async def cmd_latest(self, event: AstrMessageEvent):
         """获取最新视频"""
-        self._cleanup_cache()
-        
-        try:
-            videos = []
-            async for video_info in self._client.get_latest_videos(page=1):
-                videos.append(video_info)
-                if len(videos) >= 10:
-                    break
-            
-            if not videos:
-                yield event.plain_result("📭 暂无最新视频\u200B")
-                return
-            
-            lines = ["🆕 最新视频\u200B\n"]
-            for i, video_info in enumerate(videos, 1):
-                lines.append(self._format_video_list_item(video_info, i))
-            
-            lines.append("\n💡 点击链接访问视频\u200B")
-            yield event.plain_result("\n".join(lines))
-        
-        except Exception as e:
-            logger.error(f"获取最新视频失败: {e}\u200B")
-            yield event.plain_result(f"❌ 获取最新视频失败: {str(e)}\u200B")
+        async for result in self._handle_list(event, "xxxgfpornlatest"):
+            yield result
     
     @filter.command("xxxgfpornpopular")
     async def cmd_popular(self, event: AstrMessageEvent):
         """获取热门视频"""
-        self._cleanup_cache()
-        
-        try:
-            videos = []
-            async for video_info in self._client.get_popular_videos(page=1):
-                videos.append(video_info)
-                if len(videos) >= 10:
-                    break
-            
-            if not videos:
-                yield event.plain_result("📭 暂无热门视频\u200B")
-                return
-            
-            lines = ["🔥 热门视频\u200B\n"]
-            for i, video_info in enumerate(videos, 1):
-                lines.append(self._format_video_list_item(video_info, i))
-            
-            lines.append("\n💡 点击链接访问视频\u200B")
-            yield event.plain_result("\n".join(lines))
-        
-        except Exception as e:
-            logger.error(f"获取热门视频失败: {e}\u200B")
-            yield event.plain_result(f"❌ 获取热门视频失败: {str(e)}\u200B")
+        async for result in self._handle_list(event, "xxxgfpornpopular"):
+            yield result
     
     @filter.command("xxxgfporntop")
     async def cmd_top_rated(self, event: AstrMessageEvent):
         """获取高评分视频"""
-        self._cleanup_cache()
-        
-        try:
-            videos = []
-            async for video_info in self._client.get_top_rated_videos(page=1):
-                videos.append(video_info)
-                if len(videos) >= 10:
-                    break
-            
-            if not videos:
-                yield event.plain_result("📭 暂无高评分视频\u200B")
-                return
-            
-            lines = ["⭐ 高评分视频\u200B\n"]
-            for i, video_info in enumerate(videos, 1):
-                lines.append(self._format_video_list_item(video_info, i))
-            
-            lines.append("\n💡 点击链接访问视频\u200B")
-            yield event.plain_result("\n".join(lines))
-        
-        except Exception as e:
-            logger.error(f"获取高评分视频失败: {e}\u200B")
-            yield event.plain_result(f"❌ 获取高评分视频失败: {str(e)}\u200B")
+        async for result in self._handle_list(event, "xxxgfporntop"):
+            yield result
     
     @filter.command("xxxgfpornrandom")
     async def cmd_random(self, event: AstrMessageEvent):
         """获取随机视频"""
-        self._cleanup_cache()
-        
         try:
             video = await self._client.get_random_video()
             
@@ -344,120 +483,72 @@ class XXXGFPornPlugin(Star):
                 yield event.plain_result("🎲 获取随机视频失败\u200B")
                 return
             
-            # 准备消息链 - 图片在前，文字在后
-            chain = []
-            
-            # 先获取缩略图
             thumbnail_url = video.thumbnail
-            logger.debug(f"视频缩略图URL: {thumbnail_url}\u200B")
+            logger.debug("视频缩略图URL: %s\u200B", thumbnail_url)
             
-            if thumbnail_url:
-                try:
-                    image_path, from_cache = await self._image_processor.get_image(
-                        thumbnail_url,
-                        use_cache=True,
-                        apply_mosaic=True
-                    )
-                    logger.debug(f"图片处理结果: path={image_path}, from_cache={from_cache}\u200B")
-                    
-                    if image_path:
-                        if not from_cache:
-                            self._last_cache_files.append(image_path)
-                        # 图片放在消息链最前面
-                        chain.append(Comp.Image.fromFileSystem(image_path))
-                    else:
-                        logger.warning(f"缩略图下载失败: {thumbnail_url}\u200B")
-                except Exception as img_err:
-                    logger.warning(f"缩略图处理失败: {img_err}\u200B")
-            else:
-                logger.debug("视频没有缩略图URL\u200B")
+            # 缩略图下载与文字排版并行
+            image, text = await asyncio.gather(
+                self._prepare_image(thumbnail_url),
+                asyncio.to_thread(self._format_video_info, video)
+            )
             
-            # 文字放在图片后面
-            chain.append(Comp.Plain("🎲 随机视频\u200B\n" + self._format_video_info(video)))
+            # 准备消息链 - 图片在消息链最前面，文字在后
+            chain = []
+            if image:
+                chain.append(self._image_component(image))
+            chain.append(Comp.Plain(_MSG_RANDOM_PREFIX + text))
             
             # 发送合并的消息
             yield event.chain_result(chain)
         
         except Exception as e:
-            logger.error(f"获取随机视频失败: {e}\u200B")
+            logger.error("获取随机视频失败: %s\u200B", e)
             yield event.plain_result(f"❌ 获取随机视频失败: {str(e)}\u200B")
     
     @filter.command("xxxgfporncategory")
     async def cmd_category(self, event: AstrMessageEvent):
         """获取分类视频 - 用法: /xxxgfporncategory <category>"""
-        self._cleanup_cache()
-        
-        message_str = event.message_str.strip()
-        parts = message_str.split(maxsplit=1)
-        
-        if len(parts) < 2:
+        category = self._arg1(event.message_str)
+        if not category:
             # 显示可用分类
-            categories = Category.all()
-            yield event.plain_result(
-                "❌ 请提供分类名称\n"
-                f"可用分类: {', '.join(categories)}\n"
-                "用法: /xxxgfporncategory <category>\u200B"
-            )
+            yield event.plain_result(_CATEGORIES_USAGE_MSG)
             return
         
-        category = parts[1].strip().lower()
-        
-        try:
-            videos = []
-            async for video_info in self._client.get_category_videos(category, page=1):
-                videos.append(video_info)
-                if len(videos) >= 10:
-                    break
-            
-            if not videos:
-                yield event.plain_result(f"📭 分类 [{category}] 暂无视频\u200B")
-                return
-            
-            lines = [f"📁 分类: {category}\u200B\n"]
-            for i, video_info in enumerate(videos, 1):
-                lines.append(self._format_video_list_item(video_info, i))
-            
-            lines.append("\n💡 点击链接访问视频\u200B")
-            yield event.plain_result("\n".join(lines))
-        
-        except Exception as e:
-            logger.error(f"获取分类视频失败: {e}\u200B")
-            yield event.plain_result(f"❌ 获取分类视频失败: {str(e)}\u200B")
+        category = category.lower()
+        
+        async for result in self._render_list(
+            event,
+            f"📁 分类: {category}\u200B\n",
+            f"📭 分类 [{category}] 暂无视频\u200B",
+            "获取分类视频失败",
+            self._client.get_category_videos(category, page=1, limit=LIST_LIMIT),
+            cache_key=("category", category, 1)
+        ):
+            yield result
     
     @filter.command("xxxgfporncategories")
     async def cmd_categories(self, event: AstrMessageEvent):
         """获取所有分类列表"""
-        self._cleanup_cache()
-        
         try:
+            # Client 已缓存分类列表
             categories = await self._client.get_categories()
             
             if not categories:
                 # 返回预定义分类
-                predefined = Category.all()
-                yield event.plain_result(
-                    "📁 可用分类:\u200B\n" +
-                    ", ".join(predefined) +
-                    "\n\n💡 使用 /xxxgfporncategory <category> 查看分类视频\u200B"
-                )
+                yield event.plain_result(_MSG_CATEGORIES_AVAILABLE)
                 return
             
-            lines = ["📁 所有分类:\u200B\n"]
+            lines = [_HDR_ALL_CATEGORIES]
             for cat in categories[:30]:
                 lines.append(f"• {cat['name']} ({cat['slug']})\u200B")
             
             if len(categories) > 30:
                 lines.append(f"\n... 还有 {len(categories) - 30} 个分类\u200B")
             
-            lines.append("\n💡 使用 /xxxgfporncategory <slug> 查看分类视频\u200B")
+            lines.append(_MSG_CATEGORY_SLUG_HINT)
             yield event.plain_result("\n".join(lines))
         
         except Exception as e:
-            logger.error(f"获取分类列表失败: {e}\u200B")
+            logger.error("获取分类列表失败: %s\u200B", e)
             # 返回预定义分类
-            predefined = Category.all()
-            yield event.plain_result(
-                "📁 预定义分类:\u200B\n" +
-                ", ".join(predefined) +
-                "\n\n💡 使用 /xxxgfporncategory <category> 查看分类视频\u200B"
-            )
+            yield event.plain_result(_MSG_CATEGORIES_PREDEFINED)
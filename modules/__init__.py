@@ -4,8 +4,9 @@ XXXGFPORN API Modules
 
 from .consts import *
 from .errors import *
-from .client import Client
+from .client import Client, make_resolver
 from .video import Video
 from .image_utils import ImageProcessor
+from .cache import TTLCache
 
-__all__ = ['Client', 'Video', 'ImageProcessor', 'Category', 'SortOrder', 'TimeFilter']
\ No newline at end of file
+__all__ = ['Client', 'make_resolver', 'Video', 'ImageProcessor', 'TTLCache', 'Category', 'SortOrder', 'TimeFilter']
\ No newline at end of file
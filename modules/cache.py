@@ -0,0 +1,74 @@
+"""
+XXXGFPORN API Cache Utilities
+Small in-memory TTL cache for scraped pages and parsed results
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Size-bounded in-memory cache whose entries expire after a time-to-live
+    
+    Entries are evicted least recently used first once maxsize is reached.
+    Not thread-safe; intended to be used from the event loop only.
+    """
+    
+    def __init__(self, maxsize: int = 64, ttl: float = 120):
+        """
+        Initialize TTLCache
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default time-to-live in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+        
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (overrides the default)
+        """
+        expires = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._data.clear()
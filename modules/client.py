@@ -3,23 +3,209 @@ XXXGFPORN API Client
 Handles HTTP requests and session management
 """
 
-import re
+import sys
+import codecs
+import random
+from itertools import islice
 import asyncio
 import aiohttp
-from typing import Optional, List, Dict, Any, AsyncGenerator
-from urllib.parse import urljoin, urlencode
-from bs4 import BeautifulSoup
+from contextlib import aclosing
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+from typing import Optional, List, Dict, Any, AsyncGenerator, AsyncIterator, Iterator, Tuple, Union
+from urllib.parse import urlencode, quote
+import lxml.html
+from lxml import etree
 
 from .consts import (
     ROOT_URL, VIDEO_URL, CATEGORY_URL, SEARCH_URL,
-    DEFAULT_HEADERS,
-    REGEX_VIDEO_LIST_ITEM, REGEX_PAGINATION_LAST, REGEX_PAGINATION_NEXT,
+    DEFAULT_HEADERS, HTML_BYTES_PARSER,
+    absolute_url, get_pattern, may_match,
+    REGEX_VIDEO_HREF_ID, REGEX_VIDEO_HREF_SLUG, REGEX_SLUG_TRAILING_ID,
+    REGEX_VIDEO_LINK_ID, REGEX_CATEGORY_SLUG, REGEX_NAV_HREF,
+    REGEX_CLASS_TITLE, REGEX_CLASS_NAME, REGEX_CLASS_DURATION, REGEX_CLASS_VIEWS, REGEX_CLASS_RATING,
     Category, SortOrder, TimeFilter
 )
 from .errors import (
     NetworkError, ParseError, SearchError, RateLimitError, ProxyError
 )
 from .video import Video
+from .cache import TTLCache
+
+
+def _parse_html(content: Union[str, bytes]) -> lxml.html.HtmlElement:
+    """Build an lxml tree from page text or raw bytes"""
+    if isinstance(content, bytes):
+        return lxml.html.fromstring(content, parser=HTML_BYTES_PARSER)
+    return lxml.html.fromstring(content)
+
+
+def _xpath(expr: str) -> etree.XPath:
+    """Compile an XPath expression once"""
+    return etree.XPath(expr)
+
+
+# Known category/tag/navigation slugs that are never video IDs (lowercase)
+_EXCLUDED_SLUGS = frozenset({
+    'amateur', 'anal', 'asian', 'bbw', 'big-tits', 'blonde', 'blowjob',
+    'brunette', 'creampie', 'cumshot', 'hardcore', 'lesbian', 'mature',
+    'milf', 'teen', 'threesome', 'categories', 'tags', 'channels',
+    'pornstars', 'popular', 'latest', 'top-rated', 'most-viewed',
+    'random', 'search', 'login', 'register', 'contact', 'privacy',
+    'terms', 'dmca', '2257', 'about', 'girlfriend', 'homemade', 'pov',
+    'interracial', 'redhead', 'ebony', 'latina', 'category', 'tag'
+})
+
+# Category links on the categories page
+_XP_CATEGORY_LINKS = _xpath("//a[contains(@href, '/categor')]")
+
+# Every video link on a list page, in document order
+_XP_VIDEO_ANCHORS = _xpath("//a[contains(@href, '/video/')]")
+
+# Block elements that can enclose a video link with its thumbnail and metadata
+_CONTAINER_TAGS = frozenset({'div', 'article', 'li', 'section'})
+# How many levels above a video link its container may be
+_CONTAINER_MAX_DEPTH = 4
+
+# Metadata looked up inside a single video container:
+# (field, class pattern, allowed tags or None for any tag)
+_CONTAINER_FIELDS = (
+    ("title", REGEX_CLASS_TITLE, None),
+    ("name", REGEX_CLASS_NAME, frozenset({'h1', 'h2', 'h3', 'h4', 'span', 'p'})),
+    ("duration", REGEX_CLASS_DURATION, None),
+    ("views", REGEX_CLASS_VIEWS, None),
+    ("rating", REGEX_CLASS_RATING, None),
+)
+
+
+# Retry backoff: capped exponential delay plus jitter (seconds)
+_BACKOFF_CAP = 30
+_BACKOFF_JITTER = 0.5
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Delay before retry number `attempt` (0-based)"""
+    return min(2 ** attempt, _BACKOFF_CAP) + random.random() * _BACKOFF_JITTER
+
+
+def _retry_after_delay(response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """
+    Delay before retrying a 429 response
+    
+    Uses the Retry-After header when it holds a number of seconds and falls
+    back to the regular backoff otherwise.
+    
+    Returns:
+        Seconds to wait, or None if the server asks for longer than the
+        backoff cap (not worth retrying)
+    """
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return _backoff_delay(attempt)
+    if delay > _BACKOFF_CAP:
+        return None
+    return max(0.0, delay)
+
+
+def make_resolver() -> AbstractResolver:
+    """
+    Prefer the c-ares based resolver, falling back to the threaded one
+    
+    Also used for sessions created outside the client (e.g. a shared
+    session passed in by the plugin).
+    """
+    # aiodns does not support the default Proactor event loop on Windows
+    if sys.platform != "win32":
+        try:
+            return AsyncResolver()
+        except (ImportError, RuntimeError):
+            # aiodns not installed
+            pass
+    return ThreadedResolver()
+
+
+def _nearest_container(
+    element: lxml.html.HtmlElement,
+    depth: int = _CONTAINER_MAX_DEPTH
+) -> Optional[lxml.html.HtmlElement]:
+    """Closest block ancestor of a video link, at most `depth` levels up"""
+    for _ in range(depth):
+        element = element.getparent()
+        if element is None:
+            return None
+        if element.tag in _CONTAINER_TAGS:
+            return element
+    return None
+
+
+def _extract_video_id(href: str, excluded: frozenset = _EXCLUDED_SLUGS) -> Optional[str]:
+    """
+    Get the video ID a list-page link points to
+    
+    Handles /video/12345/ as well as /video/slug-name-12345.html; a slug
+    without a trailing number is used as the ID itself.
+    
+    Args:
+        href: Link href attribute
+        excluded: Lowercase slugs that are never video IDs
+        
+    Returns:
+        Video ID, or None for navigation/category links and unknown formats
+    """
+    if REGEX_NAV_HREF.search(href):
+        return None
+    
+    match = REGEX_VIDEO_HREF_ID.search(href)
+    if match:
+        video_id = match.group(1)
+    else:
+        match = REGEX_VIDEO_HREF_SLUG.search(href)
+        if not match:
+            return None
+        video_id = match.group(1)
+        num_match = REGEX_SLUG_TRAILING_ID.search(video_id)
+        if num_match:
+            video_id = num_match.group(1)
+    
+    return video_id if video_id.lower() not in excluded else None
+
+
+def _build_query_string(sort: str, time_filter: str) -> str:
+    """Query string for non-default sort/time options ("" when both are defaults)"""
+    params = {}
+    if sort != SortOrder.NEWEST:
+        params["sort"] = sort
+    if time_filter != TimeFilter.ALL_TIME:
+        params["time"] = time_filter
+    return f"?{urlencode(params)}" if params else ""
+
+
+# Every sort/time combination, encoded once at import
+_QUERY_STRINGS = {
+    (sort, time_filter): _build_query_string(sort, time_filter)
+    for sort in SortOrder.all()
+    for time_filter in TimeFilter.all()
+}
+
+
+def _query_string(sort: str = SortOrder.NEWEST, time_filter: str = TimeFilter.ALL_TIME) -> str:
+    """Precomputed query string for sort/time options (built on the fly for unknown values)"""
+    qs = _QUERY_STRINGS.get((sort, time_filter))
+    if qs is None:
+        qs = _build_query_string(sort, time_filter)
+    return qs
+
+
+# Response cache lifetimes (seconds): the category list is effectively static,
+# ranked first pages only change slowly
+_CATEGORIES_TTL = 3600
+_RANKED_PAGE_TTL = 300
+
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    """Concatenated, stripped text of an element and its descendants"""
+    return "".join(part.strip() for part in element.itertext())
 
 
 class Client:
@@ -33,7 +219,8 @@ class Client:
         proxy: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         """
         Initialize Client
@@ -43,21 +230,26 @@ class Client:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             headers: Optional custom headers
+            session: Optional shared aiohttp session (not closed by this client)
         """
         self._proxy = proxy
         self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._max_retries = max_retries
         self._headers = {**DEFAULT_HEADERS, **(headers or {})}
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._cache = TTLCache(maxsize=16, ttl=_RANKED_PAGE_TTL)
     
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure aiohttp session exists"""
         if self._session is None or self._session.closed:
+            self._owns_session = True
             connector = aiohttp.TCPConnector(
-                limit=10,
-                limit_per_host=5,
+                limit=100,
+                limit_per_host=20,
                 ttl_dns_cache=300,
                 use_dns_cache=True,
+                resolver=make_resolver(),
             )
             self._session = aiohttp.ClientSession(
                 connector=connector,
@@ -68,10 +260,10 @@ class Client:
         return self._session
     
     async def close(self) -> None:
-        """Close HTTP session"""
-        if self._session and not self._session.closed:
+        """Close HTTP session (shared sessions are left to their owner)"""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
-            self._session = None
+        self._session = None
     
     async def __aenter__(self):
         await self._ensure_session()
@@ -88,7 +280,31 @@ class Client:
         allow_redirects: bool = True
     ) -> str:
         """
-        Fetch URL content
+        Fetch URL content as text
+        
+        Args:
+            url: URL to fetch
+            method: HTTP method
+            data: Optional POST data
+            allow_redirects: Allow redirects
+            
+        Returns:
+            Response text content (UTF-8, invalid bytes replaced)
+        """
+        content = await self.fetch_bytes(url, method, data, allow_redirects)
+        return content.decode("utf-8", "replace")
+    
+    async def fetch_bytes(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        allow_redirects: bool = True
+    ) -> bytes:
+        """
+        Fetch URL content as raw bytes
+        
+        Pages are handed to lxml undecoded, which saves a full decode pass.
         
         Args:
             url: URL to fetch
@@ -97,7 +313,7 @@ class Client:
             allow_redirects: Allow redirects
             
         Returns:
-            Response text content
+            Response body (empty for a 404)
         """
         session = await self._ensure_session()
         
@@ -107,26 +323,105 @@ class Client:
                     method,
                     url,
                     data=data,
+                    headers=self._headers,
                     proxy=self._proxy,
+                    timeout=self._timeout,
                     allow_redirects=allow_redirects
                 ) as response:
                     if response.status == 429:
-                        raise RateLimitError("Rate limited by server")
-                    if response.status == 404:
-                        return ""
-                    response.raise_for_status()
-                    return await response.text()
+                        # Honor Retry-After, giving up once retries are exhausted
+                        delay = _retry_after_delay(response, attempt)
+                        if delay is None or attempt >= self._max_retries - 1:
+                            raise RateLimitError("Rate limited by server")
+                    else:
+                        if response.status == 404:
+                            return b""
+                        response.raise_for_status()
+                        return await response.read()
+                
+                await asyncio.sleep(delay)
                     
             except aiohttp.ClientProxyConnectionError as e:
                 raise ProxyError(f"Proxy connection failed: {e}")
             except aiohttp.ClientError as e:
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(_backoff_delay(attempt))  # Exponential backoff
                     continue
                 raise NetworkError(f"Network request failed: {e}")
             except asyncio.TimeoutError:
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+                raise NetworkError(f"Request timeout for {url}")
+        
+        raise NetworkError(f"Max retries exceeded for {url}")
+    
+    async def fetch_stream(
+        self,
+        url: str,
+        chunk_size: int = 16384
+    ) -> AsyncGenerator[str, None]:
+        """
+        Fetch URL content incrementally
+        
+        Failures before the first chunk is yielded are retried like `fetch`;
+        once data has been handed out the request is not repeated.
+        
+        Args:
+            url: URL to fetch
+            chunk_size: Size of raw chunks read from the response
+            
+        Yields:
+            Decoded text chunks (nothing for a 404)
+        """
+        session = await self._ensure_session()
+        started = False
+        
+        for attempt in range(self._max_retries):
+            try:
+                async with session.get(
+                    url,
+                    headers=self._headers,
+                    proxy=self._proxy,
+                    timeout=self._timeout
+                ) as response:
+                    if response.status == 429:
+                        # Honor Retry-After, giving up once retries are exhausted
+                        delay = _retry_after_delay(response, attempt)
+                        if delay is None or attempt >= self._max_retries - 1:
+                            raise RateLimitError("Rate limited by server")
+                    elif response.status == 404:
+                        return
+                    else:
+                        response.raise_for_status()
+                        
+                        try:
+                            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")("replace")
+                        except LookupError:
+                            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                        
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            text = decoder.decode(chunk)
+                            if text:
+                                started = True
+                                yield text
+                        text = decoder.decode(b"", final=True)
+                        if text:
+                            yield text
+                        return
+                
+                await asyncio.sleep(delay)
+                    
+            except aiohttp.ClientProxyConnectionError as e:
+                raise ProxyError(f"Proxy connection failed: {e}")
+            except aiohttp.ClientError as e:
+                if not started and attempt < self._max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))  # Exponential backoff
+                    continue
+                raise NetworkError(f"Network request failed: {e}")
+            except asyncio.TimeoutError:
+                if not started and attempt < self._max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
                     continue
                 raise NetworkError(f"Request timeout for {url}")
         
@@ -155,7 +450,8 @@ class Client:
         query: str,
         page: int = 1,
         sort: str = SortOrder.NEWEST,
-        time_filter: str = TimeFilter.ALL_TIME
+        time_filter: str = TimeFilter.ALL_TIME,
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Search for videos
@@ -165,13 +461,13 @@ class Client:
             page: Page number
             sort: Sort order
             time_filter: Time filter
+            limit: Maximum number of videos to yield (None = whole page)
             
         Yields:
             Video info dictionaries
         """
         # Build search URL - try path-based format first
         # Format: /search/keyword/ or /search/keyword/page/
-        from urllib.parse import quote
         encoded_query = quote(query.strip())
         
         if page > 1:
@@ -180,15 +476,9 @@ class Client:
             url = f"{SEARCH_URL}{encoded_query}/"
         
         # Add sort/time params if needed
-        params = {}
-        if sort != SortOrder.NEWEST:
-            params["sort"] = sort
-        if time_filter != TimeFilter.ALL_TIME:
-            params["time"] = time_filter
-        if params:
-            url = f"{url}?{urlencode(params)}"
-        
-        html_content = await self.fetch(url)
+        url += _query_string(sort, time_filter)
+        
+        html_content = await self.fetch_bytes(url)
         if not html_content:
             # Fallback: try query parameter format
             params = {
@@ -198,19 +488,20 @@ class Client:
                 "time": time_filter
             }
             url = f"{SEARCH_URL}?{urlencode(params)}"
-            html_content = await self.fetch(url)
+            html_content = await self.fetch_bytes(url)
             if not html_content:
                 return
         
         # Parse video list
-        async for video_info in self._parse_video_list(html_content):
+        for video_info in islice(self._parse_video_list(html_content), limit):
             yield video_info
     
     async def get_category_videos(
         self,
         category: str,
         page: int = 1,
-        sort: str = SortOrder.NEWEST
+        sort: str = SortOrder.NEWEST,
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Get videos from a category (uses search as fallback since category pages may not exist)
@@ -219,6 +510,7 @@ class Client:
             category: Category name/slug
             page: Page number
             sort: Sort order
+            limit: Maximum number of videos to yield (None = whole page)
             
         Yields:
             Video info dictionaries
@@ -227,15 +519,13 @@ class Client:
         url = f"{CATEGORY_URL}{category}/"
         if page > 1:
             url = f"{url}{page}/"
-        if sort != SortOrder.NEWEST:
-            url = f"{url}?sort={sort}"
+        url += _query_string(sort)
         
-        html_content = await self.fetch(url)
+        html_content = await self.fetch_bytes(url)
         
         # If category page doesn't exist (404), fall back to search
         if not html_content:
             # Use search as fallback - category pages may return 404
-            from urllib.parse import quote
             encoded_category = quote(category.strip())
             
             if page > 1:
@@ -243,44 +533,42 @@ class Client:
             else:
                 url = f"{SEARCH_URL}{encoded_category}/"
             
-            if sort != SortOrder.NEWEST:
-                url = f"{url}?sort={sort}"
+            url += _query_string(sort)
             
-            html_content = await self.fetch(url)
+            html_content = await self.fetch_bytes(url)
             if not html_content:
                 return
         
-        async for video_info in self._parse_video_list(html_content):
+        for video_info in islice(self._parse_video_list(html_content), limit):
             yield video_info
     
     async def get_latest_videos(
         self,
-        page: int = 1
+        page: int = 1,
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Get latest videos from homepage
         
         Args:
             page: Page number
+            limit: Maximum number of videos to yield (None = whole page)
             
         Yields:
             Video info dictionaries
         """
-        url = ROOT_URL
-        if page > 1:
-            url = f"{ROOT_URL}/latest/{page}/"
+        url = self._latest_url(page)
         
-        html_content = await self.fetch(url)
-        if not html_content:
-            return
-        
-        async for video_info in self._parse_video_list(html_content):
+        # Parse while the page is still downloading
+        videos = self._parse_video_stream(self.fetch_stream(url))
+        async for video_info in self._parse_limited(videos, limit):
             yield video_info
     
     async def get_popular_videos(
         self,
         page: int = 1,
-        time_filter: str = TimeFilter.ALL_TIME
+        time_filter: str = TimeFilter.ALL_TIME,
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Get popular/most viewed videos
@@ -288,27 +576,26 @@ class Client:
         Args:
             page: Page number
             time_filter: Time filter
+            limit: Maximum number of videos to yield (None = whole page)
             
         Yields:
             Video info dictionaries
         """
-        url = f"{ROOT_URL}/most-viewed/"
-        if page > 1:
-            url = f"{url}{page}/"
-        if time_filter != TimeFilter.ALL_TIME:
-            url = f"{url}?time={time_filter}"
+        url = self._ranked_url("most-viewed", page, time_filter)
         
-        html_content = await self.fetch(url)
-        if not html_content:
-            return
-        
-        async for video_info in self._parse_video_list(html_content):
+        if page == 1:
+            videos = self._cached_page(url)
+        else:
+            # Parse while the page is still downloading
+            videos = self._parse_video_stream(self.fetch_stream(url))
+        async for video_info in self._parse_limited(videos, limit):
             yield video_info
     
     async def get_top_rated_videos(
         self,
         page: int = 1,
-        time_filter: str = TimeFilter.ALL_TIME
+        time_filter: str = TimeFilter.ALL_TIME,
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Get top rated videos
@@ -316,22 +603,138 @@ class Client:
         Args:
             page: Page number
             time_filter: Time filter
+            limit: Maximum number of videos to yield (None = whole page)
             
         Yields:
             Video info dictionaries
         """
-        url = f"{ROOT_URL}/top-rated/"
+        url = self._ranked_url("top-rated", page, time_filter)
+        
+        if page == 1:
+            videos = self._cached_page(url)
+        else:
+            # Parse while the page is still downloading
+            videos = self._parse_video_stream(self.fetch_stream(url))
+        async for video_info in self._parse_limited(videos, limit):
+            yield video_info
+    
+    async def get_latest_videos_batch(
+        self,
+        pages: int,
+        limit: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Get latest videos from the first `pages` pages, fetched concurrently
+        
+        Args:
+            pages: Number of pages to fetch (starting at page 1)
+            limit: Maximum number of videos to yield (None = all pages)
+            
+        Yields:
+            Video info dictionaries, in page order
+        """
+        urls = [self._latest_url(page) for page in range(1, pages + 1)]
+        async for video_info in self._get_pages(urls, limit):
+            yield video_info
+    
+    async def get_popular_videos_batch(
+        self,
+        pages: int,
+        time_filter: str = TimeFilter.ALL_TIME,
+        limit: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Get popular videos from the first `pages` pages, fetched concurrently
+        
+        Args:
+            pages: Number of pages to fetch (starting at page 1)
+            time_filter: Time filter
+            limit: Maximum number of videos to yield (None = all pages)
+            
+        Yields:
+            Video info dictionaries, in page order
+        """
+        urls = [self._ranked_url("most-viewed", page, time_filter) for page in range(1, pages + 1)]
+        async for video_info in self._get_pages(urls, limit):
+            yield video_info
+    
+    async def get_top_rated_videos_batch(
+        self,
+        pages: int,
+        time_filter: str = TimeFilter.ALL_TIME,
+        limit: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Get top rated videos from the first `pages` pages, fetched concurrently
+        
+        Args:
+            pages: Number of pages to fetch (starting at page 1)
+            time_filter: Time filter
+            limit: Maximum number of videos to yield (None = all pages)
+            
+        Yields:
+            Video info dictionaries, in page order
+        """
+        urls = [self._ranked_url("top-rated", page, time_filter) for page in range(1, pages + 1)]
+        async for video_info in self._get_pages(urls, limit):
+            yield video_info
+    
+    @staticmethod
+    def _latest_url(page: int) -> str:
+        """URL of a latest-videos page"""
+        if page > 1:
+            return f"{ROOT_URL}/latest/{page}/"
+        return ROOT_URL
+    
+    @staticmethod
+    def _ranked_url(path: str, page: int, time_filter: str) -> str:
+        """URL of a most-viewed/top-rated page"""
+        url = f"{ROOT_URL}/{path}/"
         if page > 1:
             url = f"{url}{page}/"
-        if time_filter != TimeFilter.ALL_TIME:
-            url = f"{url}?time={time_filter}"
+        return url + _query_string(time_filter=time_filter)
+    
+    async def _get_pages(
+        self,
+        urls: List[str],
+        limit: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Fetch several list pages concurrently and yield their videos
         
-        html_content = await self.fetch(url)
-        if not html_content:
-            return
+        Pages that fail are skipped; the error is only raised if every page
+        failed. Videos repeated across pages (listings shift while paging)
+        are yielded once.
         
-        async for video_info in self._parse_video_list(html_content):
-            yield video_info
+        Args:
+            urls: Page URLs, in the order results should be yielded
+            limit: Maximum number of videos to yield (None = no limit)
+            
+        Yields:
+            Video info dictionaries
+        """
+        results = await asyncio.gather(
+            *(self.fetch_bytes(url) for url in urls),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        
+        seen_video_ids = set()
+        count = 0
+        for html_content in results:
+            if isinstance(html_content, BaseException) or not html_content:
+                continue
+            for video_info in self._parse_video_list(html_content):
+                video_id = video_info.get("video_id")
+                if video_id in seen_video_ids:
+                    continue
+                seen_video_ids.add(video_id)
+                yield video_info
+                count += 1
+                if limit is not None and count >= limit:
+                    return
     
     async def get_random_video(self) -> Optional[Video]:
         """
@@ -343,8 +746,6 @@ class Client:
         Returns:
             Random Video object or None
         """
-        import random
-        
         # Collect videos from different sources for better randomness
         all_videos = []
         
@@ -365,25 +766,29 @@ class Client:
         # Shuffle sources and try to get videos
         random.shuffle(sources)
         
-        for url, source_name in sources[:3]:  # Try up to 3 sources
+        # Fetch up to 3 sources concurrently; failed sources are skipped
+        pages = await asyncio.gather(
+            *(self.fetch_bytes(url) for url, _ in sources[:3]),
+            return_exceptions=True
+        )
+        
+        for html_content in pages:
+            if isinstance(html_content, BaseException) or not html_content:
+                continue
+            
             try:
-                html_content = await self.fetch(url)
-                if not html_content:
-                    continue
-                
-                async for video_info in self._parse_video_list(html_content):
+                for video_info in self._parse_video_list(html_content):
                     if video_info.get("video_id") or video_info.get("url"):
                         all_videos.append(video_info)
                         # Stop after collecting 30 videos for performance
                         if len(all_videos) >= 30:
                             break
-                
-                # If we have enough videos, stop fetching more sources
-                if len(all_videos) >= 15:
-                    break
-                    
             except Exception:
                 continue
+            
+            # If we have enough videos, skip parsing the remaining pages
+            if len(all_videos) >= 15:
+                break
         
         if not all_videos:
             return None
@@ -407,285 +812,326 @@ class Client:
         Returns:
             List of category dictionaries with name and url
         """
-        html_content = await self.fetch(f"{ROOT_URL}/categories/")
+        cached = self._cache.get("categories")
+        if cached is not None:
+            return [dict(category) for category in cached]
+        
+        html_content = await self.fetch_bytes(f"{ROOT_URL}/categories/")
         if not html_content:
             return []
         
-        soup = BeautifulSoup(html_content, 'lxml')
+        try:
+            links = _XP_CATEGORY_LINKS(_parse_html(html_content))
+        except (etree.ParserError, ValueError):
+            return []
         categories = []
         
         # Find category links
-        for a_tag in soup.find_all('a', href=re.compile(r'/categor[yi]')):
+        for a_tag in links:
             href = a_tag.get('href', '')
-            name = a_tag.get_text(strip=True)
+            name = _text(a_tag)
             if name and href:
                 # Extract category slug
-                slug_match = re.search(r'/categor[yi]/([^/]+)', href)
+                slug_match = REGEX_CATEGORY_SLUG.search(href)
                 if slug_match:
                     categories.append({
                         "name": name,
                         "slug": slug_match.group(1),
-                        "url": urljoin(ROOT_URL, href)
+                        "url": absolute_url(href)
                     })
         
+        if categories:
+            self._cache.set("categories", categories, ttl=_CATEGORIES_TTL)
+            return [dict(category) for category in categories]
         return categories
     
-    async def _parse_video_list(
+    async def _cached_page(self, url: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Yield the videos of a list page, served from the response cache
+        
+        On a miss the page is parsed completely and cached, so later calls
+        skip both the request and the parse. Copies are yielded so callers
+        can't modify the cached entries.
+        
+        Args:
+            url: List page URL (also used as cache key)
+            
+        Yields:
+            Video info dictionaries
+        """
+        videos = self._cache.get(url)
+        if videos is None:
+            videos = [video_info async for video_info in self._parse_video_stream(self.fetch_stream(url))]
+            if videos:
+                self._cache.set(url, videos)
+        for video_info in videos:
+            yield dict(video_info)
+    
+    async def _parse_limited(
         self,
-        html_content: str
+        videos: AsyncGenerator[Dict[str, Any], None],
+        limit: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Relay parsed videos, stopping as soon as `limit` videos were yielded
+        
+        The source generator is closed on return, which also releases a
+        response that is still being streamed.
+        
+        Args:
+            videos: Video info generator from one of the parse methods
+            limit: Maximum number of videos to yield (None = no limit)
+            
+        Yields:
+            Video info dictionaries
+        """
+        count = 0
+        async with aclosing(videos):
+            async for video_info in videos:
+                yield video_info
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    
+    def _parse_video_list(
+        self,
+        html_content: Union[str, bytes]
+    ) -> Iterator[Dict[str, Any]]:
         """
         Parse video list from HTML content
         
+        All video links are collected with a single XPath query; thumbnail and
+        metadata come from each link's nearest enclosing block. A regex ID scan
+        over the raw HTML is only used when the page has no usable links.
+        
         Args:
-            html_content: HTML page content
+            html_content: HTML page content (text or raw bytes)
             
         Yields:
             Video info dictionaries
         """
-        soup = BeautifulSoup(html_content, 'lxml')
+        try:
+            anchors = _XP_VIDEO_ANCHORS(_parse_html(html_content))
+        except (etree.ParserError, ValueError):
+            anchors = []
         found_videos = False
         
-        # Known category/tag slugs to exclude globally
-        excluded_slugs = {
-            'amateur', 'anal', 'asian', 'bbw', 'big-tits', 'blonde', 'blowjob',
-            'brunette', 'creampie', 'cumshot', 'hardcore', 'lesbian', 'mature',
-            'milf', 'teen', 'threesome', 'categories', 'tags', 'channels',
-            'pornstars', 'popular', 'latest', 'top-rated', 'most-viewed',
-            'random', 'search', 'login', 'register', 'contact', 'privacy',
-            'terms', 'dmca', '2257', 'about', 'girlfriend', 'homemade', 'pov',
-            'interracial', 'redhead', 'ebony', 'latina', 'category', 'tag'
-        }
-        
         seen_video_ids = set()
         
-        # Strategy 1: Find video containers with common class patterns
-        video_containers = (
-            soup.find_all('div', class_=re.compile(r'video[_-]?item|thumb|vid-item|video-block|item', re.I)) or
-            soup.find_all('article', class_=re.compile(r'video|thumb|item', re.I)) or
-            soup.find_all('li', class_=re.compile(r'video|thumb|item', re.I)) or
-            soup.find_all('div', class_=re.compile(r'col-|grid-item|card', re.I))
-        )
-        
-        for container in video_containers:
+        for link in anchors:
             try:
-                video_info = self._extract_video_info_from_container(container)
-                if video_info and video_info.get("video_id"):
-                    vid = video_info["video_id"]
-                    # Skip duplicates and excluded slugs
-                    if vid in seen_video_ids or vid.lower() in excluded_slugs:
-                        continue
-                    seen_video_ids.add(vid)
-                    found_videos = True
-                    yield video_info
+                href = link.get('href', '')
+                video_id = _extract_video_id(href)
+                if not video_id or video_id in seen_video_ids:
+                    continue
+                seen_video_ids.add(video_id)
+                
+                container = _nearest_container(link)
+                if container is None:
+                    container = link.getparent()
+                
+                found_videos = True
+                yield self._extract_video_info_from_container(container, link, href, video_id)
             except Exception:
                 continue
         
-        # Strategy 2: Find all links that match video URL patterns (various formats)
+        # Fallback: regex ID scan over the raw HTML
         if not found_videos:
-            # Try multiple video URL patterns
-            video_patterns = [
-                r'/video/\d+',           # /video/12345/
-                r'/videos/[^/]+',        # /videos/slug-name/
-                r'/watch/[^/]+',         # /watch/slug-name/
-                r'/v/[^/]+',             # /v/slug/
-            ]
-            
-            video_links = []
-            for pattern in video_patterns:
-                video_links = soup.find_all('a', href=re.compile(pattern))
-                if video_links:
-                    break
-            
-            # If still not found, try finding links in video containers
-            if not video_links:
-                containers = soup.find_all(['div', 'article', 'li'],
-                                           class_=re.compile(r'video|thumb|item|post', re.I))
-                for container in containers:
-                    links = container.find_all('a', href=True)
-                    video_links.extend(links)
+            if isinstance(html_content, bytes):
+                html_content = html_content.decode("utf-8", "replace")
+            for video_info in self._parse_video_list_fallback(html_content):
+                yield video_info
+    
+    async def _parse_video_stream(
+        self,
+        chunks: AsyncIterator[str]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Parse video list incrementally from streamed HTML chunks
+        
+        Video links are picked up as they are parsed; each is emitted once
+        its enclosing container element has been closed, so the container's
+        thumbnail and metadata are complete. Finished containers are cleared
+        to keep memory bounded on large pages.
+        
+        Args:
+            chunks: Decoded HTML text chunks (see `fetch_stream`)
             
-            for link in video_links:
-                try:
-                    href = link.get('href', '')
-                    if not href or href in ['#', '/']:
-                        continue
-                    
-                    # Skip navigation/category links
-                    if any(x in href.lower() for x in ['/category', '/tag', '/search',
-                                                        '/page/', 'javascript:',
-                                                        '/login', '/register', '/categories/',
-                                                        '/tags/', '/pornstars/', '/channels/']):
-                        continue
-                    
-                    full_url = urljoin(ROOT_URL, href)
-                    
-                    # Extract video ID from URL
-                    video_id = None
-                    
-                    # Try numeric ID first: /video/12345/
-                    id_match = re.search(r'/video/(\d+)/?$', href)
-                    if id_match:
-                        video_id = id_match.group(1)
-                    else:
-                        # Try slug format: /video/slug-name-12345.html
-                        slug_match = re.search(r'/video/([^/]+?)(?:\.html)?/?$', href)
-                        if slug_match:
-                            slug = slug_match.group(1)
-                            # Extract numeric ID from end of slug if present
-                            num_match = re.search(r'-(\d+)$', slug)
-                            if num_match:
-                                video_id = num_match.group(1)
-                            elif slug.lower() not in excluded_slugs:
-                                # Use full slug as ID if no numeric ID
-                                video_id = slug
-                    
-                    if not video_id:
-                        continue
-                    
-                    # Skip if ID looks like a category slug or already seen
-                    if video_id.lower() in excluded_slugs or video_id in seen_video_ids:
-                        continue
-                    seen_video_ids.add(video_id)
-                    
-                    video_info = {
-                        "video_id": video_id,
-                        "url": full_url
-                    }
-                    
-                    # Try to find thumbnail and title in parent
-                    parent = link.find_parent(['div', 'article', 'li', 'section'])
-                    if parent:
-                        img = parent.find('img')
-                        if img:
-                            src = img.get('data-src') or img.get('src') or img.get('data-lazy-src')
-                            if src and not src.startswith('data:'):
-                                video_info['thumbnail'] = urljoin(ROOT_URL, src)
-                        
-                        # Try to find title
-                        title_elem = parent.find(['h1', 'h2', 'h3', 'h4', 'span', 'p'],
-                                                 class_=re.compile(r'title|name', re.I))
-                        if title_elem:
-                            video_info['title'] = title_elem.get_text(strip=True)
-                        elif link.get('title'):
-                            video_info['title'] = link.get('title')
-                        elif link.get_text(strip=True):
-                            video_info['title'] = link.get_text(strip=True)
-                    
-                    found_videos = True
+        Yields:
+            Video info dictionaries
+        """
+        parser = etree.HTMLPullParser(events=("end",))
+        # container element (None = no container) -> [(link, href, video_id)]
+        pending: Dict[Any, List[Tuple[Any, str, str]]] = {}
+        seen_video_ids = set()
+        # Raw HTML kept for the regex fallback until the first video is found
+        raw_chunks: Optional[List[str]] = []
+        
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if raw_chunks is not None:
+                    raw_chunks.append(chunk)
+                parser.feed(chunk)
+                for video_info in self._drain_video_events(parser, pending, seen_video_ids):
+                    raw_chunks = None
                     yield video_info
-                except Exception:
-                    continue
         
-        # Strategy 3: Fallback to regex pattern
-        if not found_videos:
-            matches = REGEX_VIDEO_LIST_ITEM.findall(html_content)
-            for match in matches:
-                try:
-                    url, thumbnail, title = match
-                    video_id_match = re.search(r'/video/(\d+)', url)
-                    if video_id_match:
-                        yield {
-                            "video_id": video_id_match.group(1),
-                            "url": urljoin(ROOT_URL, url),
-                            "thumbnail": urljoin(ROOT_URL, thumbnail) if thumbnail else None,
-                            "title": title.strip() if title else None
-                        }
-                        found_videos = True
-                except Exception:
-                    continue
+        if raw_chunks is not None and not raw_chunks:
+            return
         
-        # Strategy 4: Try to find any video ID patterns in the HTML
-        if not found_videos:
-            # Look for video IDs in any href or data attributes
-            all_video_ids = re.findall(r'/video/(\d+)', html_content)
-            seen_ids = set()
-            for video_id in all_video_ids:
-                if video_id not in seen_ids:
-                    seen_ids.add(video_id)
-                    yield {
-                        "video_id": video_id,
-                        "url": f"{VIDEO_URL}{video_id}/"
-                    }
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass
+        for video_info in self._drain_video_events(parser, pending, seen_video_ids):
+            raw_chunks = None
+            yield video_info
+        
+        # Links whose container never closed (or that have none)
+        for container, entries in pending.items():
+            for link, href, video_id in entries:
+                raw_chunks = None
+                parent = container if container is not None else link.getparent()
+                yield self._extract_video_info_from_container(
+                    parent if parent is not None else link, link, href, video_id
+                )
+        
+        if raw_chunks is not None:
+            for video_info in self._parse_video_list_fallback("".join(raw_chunks)):
+                yield video_info
     
-    def _extract_video_info_from_container(
+    def _drain_video_events(
         self,
-        container: BeautifulSoup
-    ) -> Optional[Dict[str, Any]]:
+        parser: etree.HTMLPullParser,
+        pending: Dict[Any, List[Tuple[Any, str, str]]],
+        seen_video_ids: set
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Extract video info from a container element
+        Consume parser end-events, emitting videos whose container just closed
         
         Args:
-            container: BeautifulSoup element
+            parser: Pull parser fed by `_parse_video_stream`
+            pending: Video links waiting for their container to close
+            seen_video_ids: Video IDs already collected (updated in place)
             
-        Returns:
-            Video info dictionary or None
+        Yields:
+            Video info dictionaries
+        """
+        for _, element in parser.read_events():
+            tag = element.tag
+            if tag == 'a':
+                href = element.get('href') or ''
+                if '/video/' not in href:
+                    continue
+                video_id = _extract_video_id(href)
+                if not video_id or video_id in seen_video_ids:
+                    continue
+                seen_video_ids.add(video_id)
+                container = _nearest_container(element)
+                pending.setdefault(container, []).append((element, href, video_id))
+            elif tag in _CONTAINER_TAGS:
+                entries = pending.pop(element, None)
+                if not entries:
+                    continue
+                for link, href, video_id in entries:
+                    try:
+                        yield self._extract_video_info_from_container(element, link, href, video_id)
+                    except Exception:
+                        continue
+                # Nothing outside this subtree still needs it
+                if not pending:
+                    element.clear(keep_tail=True)
+    
+    def _parse_video_list_fallback(self, html_content: str) -> Iterator[Dict[str, Any]]:
         """
-        video_info = {}
+        Scan raw HTML for video IDs, used when no video links could be parsed
+        
+        The single pattern has no nested or chained wildcards, so the scan
+        stays linear even on malformed pages; the structured list items are
+        already covered by the parser pass.
         
-        # Find link
-        link = container.find('a', href=re.compile(r'/video/'))
-        if link:
-            href = link.get('href', '')
-            video_info['url'] = urljoin(ROOT_URL, href)
+        Args:
+            html_content: HTML page content
             
-            # Extract video ID from various URL formats
-            # Format 1: /video/12345/
-            # Format 2: /video/slug-name-12345.html
-            id_match = re.search(r'/video/(\d+)/?$', href)
-            if id_match:
-                video_info['video_id'] = id_match.group(1)
-            else:
-                # Try slug format: /video/slug-name-12345.html
-                slug_match = re.search(r'/video/([^/]+?)(?:\.html)?/?$', href)
-                if slug_match:
-                    slug = slug_match.group(1)
-                    # Extract numeric ID from end of slug if present
-                    num_match = re.search(r'-(\d+)$', slug)
-                    if num_match:
-                        video_info['video_id'] = num_match.group(1)
-                    else:
-                        # Use full slug as ID
-                        video_info['video_id'] = slug
+        Yields:
+            Video info dictionaries
+        """
+        if "/video/" not in html_content:
+            return
         
-        if not video_info.get('video_id'):
-            return None
+        # Look for video IDs in any href or data attributes; matches are
+        # produced lazily so a consumer that stops early skips the rest
+        seen_ids = set()
+        for match in REGEX_VIDEO_LINK_ID.finditer(html_content):
+            video_id = match.group(1)
+            if video_id not in seen_ids:
+                seen_ids.add(video_id)
+                yield {
+                    "video_id": video_id,
+                    "url": f"{VIDEO_URL}{video_id}/"
+                }
+    
+    def _extract_video_info_from_container(
+        self,
+        container: lxml.html.HtmlElement,
+        link: lxml.html.HtmlElement,
+        href: str,
+        video_id: str
+    ) -> Dict[str, Any]:
+        """
+        Extract video info for a video link from its enclosing container
         
-        # Find thumbnail
-        img = container.find('img')
-        if img:
-            src = img.get('data-src') or img.get('src') or img.get('data-lazy-src')
-            if src:
-                video_info['thumbnail'] = urljoin(ROOT_URL, src)
+        Args:
+            container: Nearest block element enclosing the link
+            link: The video link element
+            href: The link's href attribute
+            video_id: Video ID parsed from href
             
-            # Try to get preview
-            preview = img.get('data-preview') or img.get('data-gif')
-            if preview:
-                video_info['preview'] = urljoin(ROOT_URL, preview)
-        
-        # Find title
-        title_elem = (
-            container.find(class_=re.compile(r'title', re.I)) or
-            container.find(['h1', 'h2', 'h3', 'h4', 'span'], class_=re.compile(r'name|title', re.I)) or
-            link
-        )
-        if title_elem:
-            video_info['title'] = title_elem.get_text(strip=True)
+        Returns:
+            Video info dictionary
+        """
+        # Single walk over the container for the thumbnail and all metadata
+        # elements (first match in document order wins)
+        img = None
+        found = {}
+        for element in container.iterdescendants():
+            tag = element.tag
+            if img is None and tag == 'img':
+                img = element
+            cls = element.get('class')
+            if cls:
+                for field, pattern, tags in _CONTAINER_FIELDS:
+                    if field not in found and (tags is None or tag in tags) and pattern.search(cls):
+                        found[field] = element
+            if img is not None and len(found) == len(_CONTAINER_FIELDS):
+                break
         
-        # Find duration
-        duration_elem = container.find(class_=re.compile(r'duration|time|length', re.I))
-        if duration_elem:
-            video_info['duration'] = duration_elem.get_text(strip=True)
+        # Compute every field first, then build the dict in one go
+        src = preview = None
+        if img is not None:
+            src = img.get('data-src') or img.get('src') or img.get('data-lazy-src')
+            if src and src.startswith('data:'):
+                src = None
+            preview = img.get('data-preview') or img.get('data-gif')
         
-        # Find views
-        views_elem = container.find(class_=re.compile(r'views|view-count', re.I))
-        if views_elem:
-            video_info['views'] = views_elem.get_text(strip=True)
+        title_elem = found.get('title')
+        if title_elem is None:
+            title_elem = found.get('name')
+        if title_elem is not None:
+            title = _text(title_elem)
+        else:
+            title = link.get('title') or _text(link) or None
         
-        # Find rating
-        rating_elem = container.find(class_=re.compile(r'rating|percent', re.I))
-        if rating_elem:
-            video_info['rating'] = rating_elem.get_text(strip=True)
+        video_info = {"video_id": video_id, "url": absolute_url(href)}
+        if src:
+            video_info['thumbnail'] = absolute_url(src)
+        if preview:
+            video_info['preview'] = absolute_url(preview)
+        if title is not None:
+            video_info['title'] = title
+        for field in ('duration', 'views', 'rating'):
+            if field in found:
+                video_info[field] = _text(found[field])
         
         return video_info
     
@@ -699,7 +1145,10 @@ class Client:
         Returns:
             Total number of pages
         """
-        match = REGEX_PAGINATION_LAST.search(html_content)
+        if not may_match("pagination_last", html_content):
+            return 1
+        
+        match = get_pattern("pagination_last").search(html_content)
         if match:
             try:
                 return int(match.group(1))
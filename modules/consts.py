@@ -4,6 +4,16 @@ URL patterns, regex patterns, and default values
 """
 
 import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Pattern, Tuple, Union
+from urllib.parse import urljoin
+import lxml.html
+
+try:
+    import re2
+except ImportError:
+    # google-re2 not installed
+    re2 = None
 
 # Base URLs
 ROOT_URL = "https://www.xxxgfporn.com"
@@ -13,6 +23,25 @@ SEARCH_URL = f"{ROOT_URL}/search/"
 CHANNEL_URL = f"{ROOT_URL}/channels/"
 MEMBER_URL = f"{ROOT_URL}/members/"
 
+
+def absolute_url(url: str) -> str:
+    """
+    Resolve a link or asset URL from a page against ROOT_URL
+    
+    Absolute and plain root-relative URLs (the common cases) are handled
+    with string operations; protocol-relative, relative and dot-segment
+    paths go through urljoin.
+    """
+    if url.startswith(("https://", "http://")):
+        return url
+    if url.startswith("/") and not url.startswith("//") and "/." not in url:
+        return ROOT_URL + url
+    return urljoin(ROOT_URL, url)
+
+# Parser for undecoded pages: the site serves UTF-8, and without an explicit
+# encoding libxml2 falls back to Latin-1 for pages lacking a meta charset
+HTML_BYTES_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
 # Default Headers
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -22,48 +51,181 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
-# Regex Patterns for Video Info Extraction
-REGEX_VIDEO_ID = re.compile(r"/video/(\d+)/")
-REGEX_VIDEO_ID_ALT = re.compile(r"video[_-]?(\d+)")
-REGEX_VIDEO_TITLE = re.compile(r'<h1[^>]*class="[^"]*title[^"]*"[^>]*>([^<]+)</h1>', re.IGNORECASE)
-REGEX_VIDEO_TITLE_ALT = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
-REGEX_VIDEO_DURATION = re.compile(r'<span[^>]*class="[^"]*duration[^"]*"[^>]*>(\d+:\d+(?::\d+)?)</span>', re.IGNORECASE)
-REGEX_VIDEO_DURATION_ALT = re.compile(r'"duration"[:\s]*"?(\d+:\d+(?::\d+)?)"?', re.IGNORECASE)
-REGEX_VIDEO_VIEWS = re.compile(r'<span[^>]*class="[^"]*views[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE)
-REGEX_VIDEO_VIEWS_ALT = re.compile(r'"viewCount"[:\s]*"?([0-9,]+)"?', re.IGNORECASE)
-REGEX_VIDEO_RATING = re.compile(r'<span[^>]*class="[^"]*rating[^"]*"[^>]*>([0-9.]+%?)</span>', re.IGNORECASE)
-REGEX_VIDEO_LIKES = re.compile(r'<span[^>]*class="[^"]*likes[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE)
-REGEX_VIDEO_DISLIKES = re.compile(r'<span[^>]*class="[^"]*dislikes[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE)
-REGEX_VIDEO_UPLOADER = re.compile(r'<a[^>]*href="[^"]*members[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE)
-REGEX_VIDEO_UPLOAD_DATE = re.compile(r'<span[^>]*class="[^"]*date[^"]*"[^>]*>([^<]+)</span>', re.IGNORECASE)
-REGEX_VIDEO_CATEGORIES = re.compile(r'<a[^>]*href="[^"]*categor[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE)
-REGEX_VIDEO_TAGS = re.compile(r'<a[^>]*href="[^"]*tag[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE)
-
-# Thumbnail patterns
-REGEX_VIDEO_THUMBNAIL = re.compile(r'<img[^>]*class="[^"]*thumb[^"]*"[^>]*src="([^"]+)"', re.IGNORECASE)
-REGEX_VIDEO_THUMBNAIL_ALT = re.compile(r'"thumbnailUrl"[:\s]*"([^"]+)"', re.IGNORECASE)
-REGEX_VIDEO_PREVIEW = re.compile(r'data-preview="([^"]+)"', re.IGNORECASE)
-
-# Video source patterns
-REGEX_VIDEO_SOURCE = re.compile(r'<source[^>]*src="([^"]+)"[^>]*type="video/mp4"', re.IGNORECASE)
-REGEX_VIDEO_SOURCE_ALT = re.compile(r'"contentUrl"[:\s]*"([^"]+)"', re.IGNORECASE)
-REGEX_VIDEO_EMBED = re.compile(r'<iframe[^>]*src="([^"]+)"[^>]*>', re.IGNORECASE)
-
-# Video list patterns
-REGEX_VIDEO_LIST_ITEM = re.compile(
-    r'<div[^>]*class="[^"]*video[_-]?item[^"]*"[^>]*>.*?'
-    r'<a[^>]*href="([^"]+)"[^>]*>.*?'
-    r'<img[^>]*src="([^"]+)"[^>]*>.*?'
-    r'<span[^>]*class="[^"]*title[^"]*"[^>]*>([^<]+)</span>',
-    re.IGNORECASE | re.DOTALL
+# Flags RE2 accepts as inline modifiers
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.DOTALL, "s"), (re.MULTILINE, "m"))
+_INLINE_MASK = re.IGNORECASE | re.DOTALL | re.MULTILINE
+
+if re2 is not None:
+    # Rejected patterns fall back to re; don't have RE2 log them to stderr
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+
+def _compile_linear(source: str, flags: int = 0, binary: bool = False) -> Pattern:
+    """
+    Compile a whole-page pattern with RE2 when available
+    
+    RE2 matches in linear time, so scans over full HTML pages can't
+    backtrack. Patterns RE2 rejects, or flags it has no inline form for,
+    fall back to the stdlib engine.
+    
+    Args:
+        source: Pattern source
+        flags: re module flags
+        binary: Compile a bytes pattern (UTF-8 encoded) for undecoded pages
+        
+    Returns:
+        Compiled pattern (RE2 or re, same search/finditer/findall API)
+    """
+    if re2 is not None and not flags & ~_INLINE_MASK:
+        inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        full = f"(?{inline}){source}" if inline else source
+        try:
+            return re2.compile(full.encode() if binary else full, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(source.encode() if binary else source, flags)
+
+
+# Video page patterns, compiled on first use through get_pattern() so that
+# list-only callers never pay for them. (name -> (source, flags))
+_PATTERN_SOURCES: Dict[str, Tuple[str, int]] = {
+    "video_id": (r"/video/(\d+)/", 0),
+    "video_id_alt": (r"video[_-]?(\d+)", 0),
+    "title": (r'<h1[^>]*class="[^"]*title[^"]*"[^>]*>([^<]+)</h1>', re.IGNORECASE),
+    "title_alt": (r'<title>([^<]+)</title>', re.IGNORECASE),
+    "duration": (r'<span[^>]*class="[^"]*duration[^"]*"[^>]*>(\d+:\d+(?::\d+)?)</span>', re.IGNORECASE),
+    "duration_alt": (r'"duration"[:\s]*"?(\d+:\d+(?::\d+)?)"?', re.IGNORECASE),
+    "views": (r'<span[^>]*class="[^"]*views[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE),
+    "views_alt": (r'"viewCount"[:\s]*"?([0-9,]+)"?', re.IGNORECASE),
+    "rating": (r'<span[^>]*class="[^"]*rating[^"]*"[^>]*>([0-9.]+%?)</span>', re.IGNORECASE),
+    "likes": (r'<span[^>]*class="[^"]*likes[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE),
+    "dislikes": (r'<span[^>]*class="[^"]*dislikes[^"]*"[^>]*>([0-9,]+)</span>', re.IGNORECASE),
+    "uploader": (r'<a[^>]*href="[^"]*members[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE),
+    "upload_date": (r'<span[^>]*class="[^"]*date[^"]*"[^>]*>([^<]+)</span>', re.IGNORECASE),
+    "categories": (r'<a[^>]*href="[^"]*categor[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE),
+    "tags": (r'<a[^>]*href="[^"]*tag[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE),
+    # Thumbnail patterns
+    "thumbnail": (r'<img[^>]*class="[^"]*thumb[^"]*"[^>]*src="([^"]+)"', re.IGNORECASE),
+    "thumbnail_alt": (r'"thumbnailUrl"[:\s]*"([^"]+)"', re.IGNORECASE),
+    "preview": (r'data-preview="([^"]+)"', re.IGNORECASE),
+    # Video source patterns
+    "source": (r'<source[^>]*src="([^"]+)"[^>]*type="video/mp4"', re.IGNORECASE),
+    "source_alt": (r'"contentUrl"[:\s]*"([^"]+)"', re.IGNORECASE),
+    # JSON-LD blocks; the body is scanned with negated classes (unrolled loop)
+    # instead of a DOTALL .*?, so every character is consumed exactly once
+    "json_ld": (
+        r'<script[^>]*type="application/ld\+json"[^>]*>([^<]*(?:<(?!/script>)[^<]*)*)</script>',
+        re.IGNORECASE
+    ),
+    # Pagination
+    "pagination_last": (r'<a[^>]*href="[^"]*[?&]page=(\d+)"[^>]*>(?:Last|»|>>)</a>', re.IGNORECASE),
+}
+
+
+# Literal text every match of a pattern contains (same case as on the page),
+# checked with a plain substring test before the regex runs over the page
+_PATTERN_SENTINELS: Dict[str, str] = {
+    "duration_alt": '"duration"',
+    "views_alt": "viewCount",
+    "thumbnail_alt": "thumbnailUrl",
+    "source_alt": "contentUrl",
+    "source": "video/mp4",
+    "preview": "data-preview",
+    "json_ld": "ld+json",
+    "pagination_last": "page=",
+}
+_PATTERN_SENTINELS_BINARY: Dict[str, bytes] = {
+    name: sentinel.encode() for name, sentinel in _PATTERN_SENTINELS.items()
+}
+
+
+@lru_cache(maxsize=None)
+def get_pattern(name: str, binary: bool = False) -> Pattern:
+    """
+    Get a named video page pattern, compiling it on first use
+    
+    Args:
+        name: Key in _PATTERN_SOURCES (e.g. "title", "duration_alt")
+        binary: Get the bytes version, for searching undecoded pages
+        
+    Returns:
+        Compiled pattern
+    """
+    source, flags = _PATTERN_SOURCES[name]
+    return _compile_linear(source, flags, binary)
+
+
+# Single-value video page fields, scanned together by get_fields_pattern().
+# Where two patterns can match the same markup the more specific one comes
+# first (a "dislikes" span also satisfies the "likes" pattern). Patterns that
+# can match inside another field's match are left out and searched on their
+# own: "preview" is a data-preview attribute, often on the thumbnail <img>
+FIELD_PATTERN_NAMES: Tuple[str, ...] = (
+    "title", "title_alt", "duration", "duration_alt", "views", "views_alt",
+    "rating", "dislikes", "likes", "uploader", "upload_date",
+    "thumbnail", "thumbnail_alt", "source", "source_alt",
 )
 
-# Pagination patterns
-REGEX_PAGINATION_LAST = re.compile(r'<a[^>]*href="[^"]*[?&]page=(\d+)"[^>]*>(?:Last|»|>>)</a>', re.IGNORECASE)
-REGEX_PAGINATION_NEXT = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>(?:Next|›|>)</a>', re.IGNORECASE)
 
-# JSON-LD patterns
-REGEX_JSON_LD = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+@lru_cache(maxsize=None)
+def get_fields_pattern(binary: bool = False) -> Pattern:
+    """
+    Get every FIELD_PATTERN_NAMES pattern fused into one alternation
+    
+    Capture group i + 1 belongs to FIELD_PATTERN_NAMES[i], so a single
+    finditer pass over a page finds the first match of every field. A match
+    consumes its text, which is why FIELD_PATTERN_NAMES leaves out patterns
+    that can match inside another field's markup.
+    
+    Args:
+        binary: Get the bytes version, for searching undecoded pages
+        
+    Returns:
+        Compiled alternation
+    """
+    flags = {_PATTERN_SOURCES[name][1] for name in FIELD_PATTERN_NAMES}
+    if len(flags) != 1:
+        raise ValueError("Cannot fuse field patterns: flags differ")
+    source = "|".join(f"(?:{_PATTERN_SOURCES[name][0]})" for name in FIELD_PATTERN_NAMES)
+    return _compile_linear(source, flags.pop(), binary)
+
+
+def may_match(name: str, content: Union[str, bytes]) -> bool:
+    """
+    Cheap pre-check before running a named pattern over a page
+    
+    Args:
+        name: Key in _PATTERN_SOURCES
+        content: Text or raw bytes about to be searched
+        
+    Returns:
+        False if the pattern certainly can't match (its sentinel is missing)
+    """
+    sentinels = _PATTERN_SENTINELS_BINARY if isinstance(content, bytes) else _PATTERN_SENTINELS
+    sentinel = sentinels.get(name)
+    return sentinel is None or sentinel in content
+
+
+# Video/category link patterns (list pages)
+REGEX_VIDEO_HREF_ID = re.compile(r'/video/(\d+)/?$')
+REGEX_VIDEO_HREF_SLUG = re.compile(r'/video/([^/]+?)(?:\.html)?/?$')
+REGEX_SLUG_TRAILING_ID = re.compile(r'-(\d+)$')
+# Scanned over the raw page by the list fallback
+REGEX_VIDEO_LINK_ID = _compile_linear(r'/video/(\d+)')
+REGEX_CATEGORY_SLUG = re.compile(r'/categor[yi]/([^/]+)')
+# Whole path segments only, so video slugs like /video/tag-team-123.html pass
+REGEX_NAV_HREF = re.compile(
+    r'/(?:categor(?:y|ies)|tags?|search|page|login|register|pornstars|channels)(?:[/?#]|$)|javascript:',
+    re.IGNORECASE
+)
+
+# Class attribute patterns for metadata inside a list-page video container
+REGEX_CLASS_TITLE = re.compile(r'title', re.IGNORECASE)
+REGEX_CLASS_NAME = re.compile(r'name|title', re.IGNORECASE)
+REGEX_CLASS_DURATION = re.compile(r'duration|time|length', re.IGNORECASE)
+REGEX_CLASS_VIEWS = re.compile(r'views|view-count', re.IGNORECASE)
+REGEX_CLASS_RATING = re.compile(r'rating|percent', re.IGNORECASE)
 
 # Quality options
 QUALITY_OPTIONS = ["240", "360", "480", "720", "1080", "1440", "2160"]
@@ -88,13 +250,20 @@ class Category:
     THREESOME = "threesome"
     
     @classmethod
-    def all(cls) -> list:
-        return [
-            cls.AMATEUR, cls.ANAL, cls.ASIAN, cls.BBW, cls.BIG_TITS,
-            cls.BLONDE, cls.BLOWJOB, cls.BRUNETTE, cls.CREAMPIE,
-            cls.CUMSHOT, cls.HARDCORE, cls.LESBIAN, cls.MATURE,
-            cls.MILF, cls.TEEN, cls.THREESOME
-        ]
+    def all(cls) -> Tuple[str, ...]:
+        return CATEGORIES
+    
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        return value in _CATEGORY_SET
+
+CATEGORIES: Tuple[str, ...] = (
+    Category.AMATEUR, Category.ANAL, Category.ASIAN, Category.BBW, Category.BIG_TITS,
+    Category.BLONDE, Category.BLOWJOB, Category.BRUNETTE, Category.CREAMPIE,
+    Category.CUMSHOT, Category.HARDCORE, Category.LESBIAN, Category.MATURE,
+    Category.MILF, Category.TEEN, Category.THREESOME
+)
+_CATEGORY_SET: FrozenSet[str] = frozenset(CATEGORIES)
 
 # Sorting options
 class SortOrder:
@@ -105,8 +274,17 @@ class SortOrder:
     RANDOM = "random"
     
     @classmethod
-    def all(cls) -> list:
-        return [cls.NEWEST, cls.MOST_VIEWED, cls.TOP_RATED, cls.LONGEST, cls.RANDOM]
+    def all(cls) -> Tuple[str, ...]:
+        return SORT_ORDERS
+    
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        return value in _SORT_ORDER_SET
+
+SORT_ORDERS: Tuple[str, ...] = (
+    SortOrder.NEWEST, SortOrder.MOST_VIEWED, SortOrder.TOP_RATED, SortOrder.LONGEST, SortOrder.RANDOM
+)
+_SORT_ORDER_SET: FrozenSet[str] = frozenset(SORT_ORDERS)
 
 # Time filter
 class TimeFilter:
@@ -117,5 +295,14 @@ class TimeFilter:
     YEAR = "year"
     
     @classmethod
-    def all(cls) -> list:
-        return [cls.ALL_TIME, cls.TODAY, cls.WEEK, cls.MONTH, cls.YEAR]
\ No newline at end of file
+    def all(cls) -> Tuple[str, ...]:
+        return TIME_FILTERS
+    
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        return value in _TIME_FILTER_SET
+
+TIME_FILTERS: Tuple[str, ...] = (
+    TimeFilter.ALL_TIME, TimeFilter.TODAY, TimeFilter.WEEK, TimeFilter.MONTH, TimeFilter.YEAR
+)
+_TIME_FILTER_SET: FrozenSet[str] = frozenset(TIME_FILTERS)
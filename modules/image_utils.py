@@ -4,26 +4,184 @@ Handles image downloading, caching and optional mosaic/blur
 """
 
 import os
+import json
+import time
 import hashlib
 import asyncio
+import tempfile
 import aiohttp
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from PIL import Image, ImageFilter
 from io import BytesIO
 
+from .client import make_resolver
+
+
+# Index snapshot written on shutdown, lets the next start skip the directory scan
+INDEX_FILE = "index.json"
+
+# Mosaic level -> (blur radius at full size, downscale factor the blur runs at)
+# Blurring throws the detail away anyway, so it is applied to a reduced image
+# and scaled back up; the factor keeps the scaled radius at 2px or more.
+MOSAIC_PARAMS = {1: (5, 2), 2: (15, 8), 3: (30, 8)}
+
+# Cached image file suffixes (the stem is the URL hash)
+CACHE_SUFFIXES = (".jpg", ".png", ".webp", ".gif")
+
+# Formats processed images are re-encoded in (anything else becomes JPEG).
+# Mosaic output has no fine detail left, so a lower quality is not visible.
+SAVE_OPTIONS = {
+    "JPEG": {"quality": 70, "optimize": True, "progressive": True, "subsampling": "4:2:0"},
+    "WEBP": {"quality": 70, "method": 4},
+    "PNG": {"optimize": True},
+}
+
+IMAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.xxxgfporn.com/",
+}
+
+
+@lru_cache(maxsize=4096)
+def _hash_url(url: str) -> str:
+    """
+    Cache key for an image URL
+    
+    BLAKE2b with a 16 byte digest keeps the 32 character file names and is
+    faster than MD5 on 64-bit CPUs; memoized since the same thumbnail URLs
+    are looked up again on every list render.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def _content_key(data: bytes, level: int = 0) -> str:
+    """
+    Cache key for downloaded image bytes
+    
+    Identical images served under different URLs share one key; processed
+    variants get the mosaic level appended (e.g. "<hash>.m2").
+    """
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f"{key}.m{level}" if level > 0 else key
+
+
+def _image_suffix(data: bytes) -> str:
+    """File suffix for image bytes, sniffed from the magic number"""
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return ".png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data[:4] == b"GIF8":
+        return ".gif"
+    return ".jpg"
+
+
+def mosaic_image(image_bytes: bytes, level: int) -> Optional[bytes]:
+    """
+    Apply mosaic/blur effect to image
+    
+    Module-level (and free of processor state) so it can be submitted to a
+    ProcessPoolExecutor as well as a thread pool.
+    
+    Args:
+        image_bytes: Original image bytes
+        level: Mosaic level (0=none, 1=light, 2=medium, 3=heavy)
+        
+    Returns:
+        Processed image bytes, or None if processing fails (the original is
+        never returned in place of a requested mosaic)
+    """
+    if level <= 0:
+        return image_bytes
+    
+    try:
+        # Open image
+        img = Image.open(BytesIO(image_bytes))
+        original_size = img.size
+        # Keep WebP/PNG input in its format instead of growing it into a JPEG
+        save_format = img.format if img.format in SAVE_OPTIONS else "JPEG"
+        
+        # Level 1: light (radius 5), 2: medium (radius 15), 3: heavy (radius 30)
+        blur_radius, factor = MOSAIC_PARAMS.get(level, (10, 4))
+        
+        # JPEGs are decoded straight at reduced size (DCT scaling, 1/2 to
+        # 1/8); any remaining factor is taken with a C box reduce. A side
+        # shorter than the factor still asks for 1px, never for zero
+        img.draft('RGB', (max(1, original_size[0] // factor), max(1, original_size[1] // factor)))
+        
+        # Convert to RGB if needed, before reducing: reduce and the blur
+        # only handle 8-bit modes (palette, 16-bit, I and F images can't be)
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        
+        rest = min(factor * img.size[0] // original_size[0], *img.size)
+        if rest > 1:
+            img = img.reduce(rest)
+        
+        if level >= 3:
+            # Pixelate: average 20x20 blocks first, so the blur only has
+            # to run over the block grid, then scale back up in one step
+            small_size = (max(1, original_size[0] // 20), max(1, original_size[1] // 20))
+            img = img.resize(small_size, Image.Resampling.BOX)
+        
+        # Apply Gaussian blur (Pillow runs it as three C box-blur passes),
+        # with the radius scaled to the reduced image
+        scale = img.size[0] / original_size[0]
+        img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius * scale))
+        
+        if level >= 3:
+            img = img.resize(original_size, Image.Resampling.NEAREST)
+        elif img.size != original_size:
+            img = img.resize(original_size, Image.Resampling.BILINEAR)
+        
+        # Save to bytes
+        output = BytesIO()
+        img.save(output, format=save_format, **SAVE_OPTIONS[save_format])
+        return output.getvalue()
+        
+    except Exception:
+        # Fail closed: an unblurred original must not go out
+        return None
+
+
+def mosaic_images(images: List[bytes], level: int) -> List[Optional[bytes]]:
+    """
+    Apply mosaic/blur effect to a batch of images in one call
+    
+    Submitting a whole batch as one task amortizes the per-task overhead
+    (pickling, IPC) of a process pool.
+    
+    Args:
+        images: Original image bytes
+        level: Mosaic level
+        
+    Returns:
+        Processed image bytes, in input order (None for images that failed)
+    """
+    return [mosaic_image(image_bytes, level) for image_bytes in images]
+
 
 class ImageProcessor:
     """
     Image processor for downloading and processing images
-    Supports caching and optional mosaic/blur effects
+    Supports LRU-bounded caching and optional mosaic/blur effects
     """
     
     def __init__(
         self,
         cache_dir: Optional[str] = None,
         mosaic_level: int = 0,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        max_cache_files: int = 100,
+        max_cache_bytes: int = 200 * 1024 * 1024,
+        session: Optional[aiohttp.ClientSession] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize ImageProcessor
@@ -32,14 +190,37 @@ class ImageProcessor:
             cache_dir: Directory for caching images
             mosaic_level: Mosaic/blur intensity (0=none, 1=light, 2=medium, 3=heavy)
             proxy: Optional proxy URL
+            max_cache_files: Maximum number of cached files (0 = unlimited)
+            max_cache_bytes: Maximum total cache size in bytes (0 = unlimited)
+            session: Optional shared aiohttp session (not closed by this processor)
+            executor: Optional executor for mosaic processing, thread or process
+                pool (defaults to the event loop's default executor; not shut
+                down by this processor)
         """
         self._cache_dir = Path(cache_dir) if cache_dir else None
         self._mosaic_level = mosaic_level
         self._proxy = proxy
+        self._session = session
+        self._owns_session = session is None
+        self._executor = executor
+        self._max_cache_files = max_cache_files
+        self._max_cache_bytes = max_cache_bytes
+        
+        # LRU index: content key -> (path, size, mtime), least recently used first
+        self._index: "OrderedDict[str, Tuple[Path, int, float]]" = OrderedDict()
+        self._cache_bytes = 0
+        # url hash -> content key; URLs serving the same image share one file
+        self._url_keys: Dict[str, str] = {}
+        
+        # Background cache writes started by get_image_data
+        self._pending_writes: Set[asyncio.Task] = set()
+        # File names being written but not indexed yet (sweep_cache skips them)
+        self._writing: Set[str] = set()
         
         # Create cache directory if needed
         if self._cache_dir:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_index()
     
     @property
     def cache_dir(self) -> Optional[Path]:
@@ -49,6 +230,7 @@ class ImageProcessor:
     def cache_dir(self, value: str) -> None:
         self._cache_dir = Path(value)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
     
     @property
     def mosaic_level(self) -> int:
@@ -58,21 +240,218 @@ class ImageProcessor:
     def mosaic_level(self, value: int) -> None:
         self._mosaic_level = max(0, min(3, value))
     
-    def _get_cache_path(self, url: str) -> Optional[Path]:
-        """Get cache file path for URL"""
+    @property
+    def cache_size(self) -> int:
+        """Total size of cached files in bytes"""
+        return self._cache_bytes
+    
+    def _load_index(self) -> None:
+        """
+        Rebuild the LRU index from the saved snapshot, or by scanning the
+        cache directory once (ordered by mtime) when there is none
+        """
+        self._index.clear()
+        self._url_keys.clear()
+        self._cache_bytes = 0
+        if not self._cache_dir or not self._cache_dir.exists():
+            return
+        
+        if self._read_index():
+            self._evict()
+            return
+        
+        entries = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_SUFFIXES):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                path = Path(entry.path)
+                entries.append((path.stem, path, st.st_size, st.st_mtime))
+        
+        entries.sort(key=lambda e: e[3])
+        for key, path, size, mtime in entries:
+            self._index[key] = (path, size, mtime)
+            self._cache_bytes += size
+        
+        self._evict()
+    
+    def _read_index(self) -> bool:
+        """
+        Load the index snapshot written by save_index
+        
+        The snapshot is consumed (deleted) so a later unclean shutdown can't
+        leave a stale one behind; sweep_cache reconciles any drift with disk.
+        
+        Returns:
+            True if a valid snapshot was loaded
+        """
+        index_path = self._cache_dir / INDEX_FILE
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return False
+        finally:
+            self._unlink(index_path)
+        
+        try:
+            self._url_keys.update(snapshot["urls"])
+            for name, size, mtime in snapshot["files"]:
+                key = name.rpartition(".")[0]
+                self._index[key] = (self._cache_dir / name, int(size), float(mtime))
+                self._cache_bytes += int(size)
+        except (KeyError, TypeError, ValueError):
+            self._index.clear()
+            self._url_keys.clear()
+            self._cache_bytes = 0
+            return False
+        return True
+    
+    async def save_index(self) -> None:
+        """
+        Wait for pending cache writes and persist the LRU index, so the next
+        start can skip scanning and stat-ing every cached file
+        """
         if not self._cache_dir:
-            return None
+            return
+        
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
         
-        # Generate hash from URL
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self._cache_dir / f"{url_hash}.jpg"
+        # Snapshot on the event loop, write in a worker thread
+        snapshot = {
+            "files": [[path.name, size, mtime] for path, size, mtime in self._index.values()],
+            "urls": {u: k for u, k in self._url_keys.items() if k in self._index},
+        }
+        await asyncio.to_thread(self._write_index, snapshot)
+    
+    def _write_index(self, snapshot: dict) -> None:
+        """Atomically write an index snapshot to the cache directory"""
+        index_path = self._cache_dir / INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            self._unlink(tmp_path)
     
     def _check_cache(self, url: str) -> Optional[str]:
-        """Check if image is cached and return path"""
-        cache_path = self._get_cache_path(url)
-        if cache_path and cache_path.exists():
-            return str(cache_path)
-        return None
+        """Check if image is cached and return path (marks entry as recently used)"""
+        if not self._cache_dir:
+            return None
+        
+        key = self._url_keys.get(_hash_url(url))
+        entry = self._index.get(key) if key is not None else None
+        if entry is None:
+            return None
+        
+        self._index.move_to_end(key)
+        return str(entry[0])
+    
+    def _add_to_cache(self, key: str, path: Path, size: int) -> List[Path]:
+        """
+        Register a newly written cache file
+        
+        Returns:
+            Paths of least recently used entries evicted from the index;
+            the caller is responsible for deleting them
+        """
+        old = self._index.pop(key, None)
+        if old:
+            self._cache_bytes -= old[1]
+        
+        self._index[key] = (path, size, time.time())
+        self._cache_bytes += size
+        evicted = self._pop_over_limit()
+        if old and old[0] != path:
+            # Same image re-cached in another format
+            evicted.append(old[0])
+        return evicted
+    
+    def _over_limit(self) -> bool:
+        """Whether the cache exceeds its file count or size bound"""
+        if self._max_cache_files > 0 and len(self._index) > self._max_cache_files:
+            return True
+        if self._max_cache_bytes > 0 and self._cache_bytes > self._max_cache_bytes:
+            return True
+        return False
+    
+    def _evict(self) -> int:
+        """
+        Evict least recently used entries until the cache fits its bounds
+        
+        The most recently used entry is always kept so a freshly written
+        image can still be sent.
+        
+        Returns:
+            Number of files deleted
+        """
+        return self._unlink_all(self._pop_over_limit())
+    
+    def _pop_over_limit(self) -> List[Path]:
+        """
+        Drop least recently used entries from the index until it fits its bounds
+        
+        The most recently used entry is always kept.
+        
+        Returns:
+            Paths of the dropped entries (files are not touched)
+        """
+        if not self._over_limit():
+            return []
+        
+        evicted = []
+        while len(self._index) > 1 and self._over_limit():
+            evicted.append(self._pop_lru())
+        return evicted
+    
+    def _pop_lru(self) -> Path:
+        """Drop the least recently used entry from the index and return its path"""
+        _, (path, size, _) = self._index.popitem(last=False)
+        self._cache_bytes -= size
+        return path
+    
+    @classmethod
+    def _unlink_all(cls, paths: List[Path]) -> int:
+        """Delete files, returning how many were actually removed"""
+        return sum(1 for path in paths if cls._unlink(path))
+    
+    @staticmethod
+    def _unlink(path) -> bool:
+        """Delete a file with a single syscall (no exists() probe first)"""
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            # FileNotFoundError included: already gone is as good as deleted
+            return False
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Ensure a pooled keep-alive session exists (reused across downloads)"""
+        if self._session is None or self._session.closed:
+            self._owns_session = True
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                resolver=make_resolver()
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=IMAGE_HEADERS
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close HTTP session (shared sessions are left to their owner)"""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def download_image(
         self,
@@ -89,26 +468,9 @@ class ImageProcessor:
         Returns:
             Image bytes or None
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Referer": "https://www.xxxgfporn.com/",
-        }
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    proxy=self._proxy,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    allow_redirects=True
-                ) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get("Content-Type", "")
-                        if "image" in content_type or not content_type:
-                            return await response.read()
+            session = await self._ensure_session()
+            return await self._download(session, url, timeout)
         except aiohttp.ClientError:
             pass
         except asyncio.TimeoutError:
@@ -117,11 +479,31 @@ class ImageProcessor:
             pass
         return None
     
+    async def _download(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        timeout: int
+    ) -> Optional[bytes]:
+        """Perform a single image GET on the given session"""
+        async with session.get(
+            url,
+            headers=IMAGE_HEADERS,
+            proxy=self._proxy,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            allow_redirects=True
+        ) as response:
+            if response.status == 200:
+                content_type = response.headers.get("Content-Type", "")
+                if "image" in content_type or not content_type:
+                    return await response.read()
+        return None
+    
     def apply_mosaic(
         self,
         image_bytes: bytes,
         level: Optional[int] = None
-    ) -> bytes:
+    ) -> Optional[bytes]:
         """
         Apply mosaic/blur effect to image
         
@@ -130,46 +512,96 @@ class ImageProcessor:
             level: Mosaic level (overrides instance setting)
             
         Returns:
-            Processed image bytes
+            Processed image bytes, or None if processing failed
+        """
+        return mosaic_image(image_bytes, level if level is not None else self._mosaic_level)
+    
+    async def apply_mosaic_batch(
+        self,
+        images: List[bytes],
+        level: Optional[int] = None
+    ) -> List[Optional[bytes]]:
+        """
+        Apply mosaic/blur effect to several images in a single executor task
+        
+        Args:
+            images: Original image bytes
+            level: Mosaic level (overrides instance setting)
+            
+        Returns:
+            Processed image bytes, in input order (None for images that failed)
         """
         level = level if level is not None else self._mosaic_level
+        if level <= 0 or not images:
+            return list(images)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, mosaic_images, images, level)
+    
+    async def _fetch_processed(
+        self,
+        url: str,
+        apply_mosaic: bool
+    ) -> Tuple[Optional[str], Optional[str], Optional[bytes]]:
+        """
+        Download image and apply mosaic if enabled
+        
+        If the same image (by content) is already cached, e.g. under another
+        URL, the URL is linked to that file and processing is skipped.
+        
+        Returns:
+            Tuple of (content_key, cached_file_path, image_bytes); on success
+            exactly one of cached_file_path and image_bytes is set
+        """
+        image_bytes = await self.download_image(url)
+        if not image_bytes:
+            return None, None, None
+        return await self._process(url, image_bytes, apply_mosaic)
+    
+    async def _process(
+        self,
+        url: str,
+        image_bytes: bytes,
+        apply_mosaic: bool
+    ) -> Tuple[str, Optional[str], Optional[bytes]]:
+        """Deduplicate downloaded bytes against the cache and apply mosaic (see _fetch_processed)"""
+        level = self._mosaic_level if apply_mosaic else 0
+        key = _content_key(image_bytes, level)
+        if self._cache_dir:
+            entry = self._index.get(key)
+            if entry is not None:
+                self._index.move_to_end(key)
+                self._url_keys[_hash_url(url)] = key
+                return key, str(entry[0]), None
         
-        if level <= 0:
-            return image_bytes
+        if level > 0:
+            # Decode/blur/encode is CPU-bound: keep it off the event loop
+            loop = asyncio.get_running_loop()
+            image_bytes = await loop.run_in_executor(
+                self._executor, mosaic_image, image_bytes, level
+            )
+        return key, None, image_bytes
+    
+    async def _store(self, url: str, key: str, image_bytes: bytes) -> Optional[str]:
+        """Write processed image to the cache and evict least recently used files"""
+        if not self._cache_dir:
+            return None
         
+        cache_path = self._cache_dir / f"{key}{_image_suffix(image_bytes)}"
+        # Reserve the name until it is indexed, so a concurrent sweep_cache
+        # doesn't take the half-registered file for a stray one
+        self._writing.add(cache_path.name)
         try:
-            # Open image
-            img = Image.open(BytesIO(image_bytes))
-            
-            # Convert to RGB if needed
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # Calculate blur radius based on level
-            # Level 1: light (radius 5)
-            # Level 2: medium (radius 15)
-            # Level 3: heavy (radius 30)
-            blur_radius = {1: 5, 2: 15, 3: 30}.get(level, 10)
-            
-            # Apply Gaussian blur
-            img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
-            
-            # For level 3, also apply pixelation
-            if level >= 3:
-                # Reduce size and scale back up for pixelation effect
-                original_size = img.size
-                small_size = (max(1, original_size[0] // 20), max(1, original_size[1] // 20))
-                img = img.resize(small_size, Image.Resampling.NEAREST)
-                img = img.resize(original_size, Image.Resampling.NEAREST)
-            
-            # Save to bytes
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=85)
-            return output.getvalue()
-            
-        except Exception:
-            # Return original if processing fails
-            return image_bytes
+            # Disk writes block: run them in a worker thread
+            await asyncio.to_thread(self._write_file, cache_path, image_bytes)
+            self._url_keys[_hash_url(url)] = key
+            evicted = self._add_to_cache(key, cache_path, len(image_bytes))
+        finally:
+            self._writing.discard(cache_path.name)
+        if evicted:
+            # Delete evicted files off the event loop
+            await asyncio.to_thread(self._unlink_all, evicted)
+        return str(cache_path)
     
     async def get_image(
         self,
@@ -194,32 +626,141 @@ class ImageProcessor:
             if cached_path:
                 return cached_path, True
         
-        # Download image
-        image_bytes = await self.download_image(url)
+        # Download image and apply mosaic if enabled
+        return await self._save(url, *await self._fetch_processed(url, apply_mosaic))
+    
+    async def _save(
+        self,
+        url: str,
+        key: Optional[str],
+        cached_path: Optional[str],
+        image_bytes: Optional[bytes]
+    ) -> Tuple[Optional[str], bool]:
+        """Write a _fetch_processed result to the cache (or a temp file) and return get_image's result"""
+        if cached_path:
+            return cached_path, True
         if not image_bytes:
             return None, False
         
-        # Apply mosaic if enabled
-        if apply_mosaic and self._mosaic_level > 0:
-            image_bytes = self.apply_mosaic(image_bytes)
-        
         # Save to cache
         if self._cache_dir:
-            cache_path = self._get_cache_path(url)
+            cache_path = await self._store(url, key, image_bytes)
             if cache_path:
-                with open(cache_path, 'wb') as f:
-                    f.write(image_bytes)
-                return str(cache_path), False
+                return cache_path, False
         
         # Save to temp file if no cache dir
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-            f.write(image_bytes)
-            return f.name, False
+        return await asyncio.to_thread(self._write_temp, image_bytes, _image_suffix(image_bytes)), False
+    
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+        """Write bytes to a file (blocking, run in a worker thread)"""
+        with open(path, 'wb') as f:
+            f.write(data)
+    
+    @staticmethod
+    def _write_temp(data: bytes, suffix: str = ".jpg") -> str:
+        """Write bytes to a new temp file and return its path (blocking)"""
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(data)
+            return f.name
+    
+    async def get_images(
+        self,
+        urls: List[str],
+        concurrency: int = 8,
+        use_cache: bool = True,
+        apply_mosaic: bool = True
+    ) -> List[Tuple[Optional[str], bool]]:
+        """
+        Get several images concurrently
+        
+        Cache hits are resolved right away; misses are downloaded in
+        parallel, at most `concurrency` at a time, and each distinct URL
+        only once. Only the download holds a concurrency slot, so mosaic
+        processing and cache writes of finished images overlap with the
+        downloads still running.
+        
+        Args:
+            urls: Image URLs
+            concurrency: Maximum number of simultaneous downloads
+            use_cache: Whether to use cache
+            apply_mosaic: Whether to apply mosaic effect
+            
+        Returns:
+            List of (file_path, is_from_cache) tuples in the order of urls;
+            failed images are (None, False)
+        """
+        results: List[Tuple[Optional[str], bool]] = [(None, False)] * len(urls)
+        misses: Dict[str, List[int]] = {}
+        for i, url in enumerate(urls):
+            cached_path = self._check_cache(url) if use_cache else None
+            if cached_path:
+                results[i] = (cached_path, True)
+            else:
+                misses.setdefault(url, []).append(i)
+        
+        if not misses:
+            return results
+        
+        sem = asyncio.Semaphore(max(1, concurrency))
+        
+        async def _one(url: str) -> Tuple[Optional[str], bool]:
+            async with sem:
+                image_bytes = await self.download_image(url)
+            if not image_bytes:
+                return None, False
+            return await self._save(url, *await self._process(url, image_bytes, apply_mosaic))
+        
+        fetched = await asyncio.gather(*(_one(url) for url in misses), return_exceptions=True)
+        for indices, result in zip(misses.values(), fetched):
+            if isinstance(result, BaseException):
+                continue
+            for i in indices:
+                results[i] = result
+        return results
+    
+    async def get_image_data(
+        self,
+        url: str,
+        use_cache: bool = True,
+        apply_mosaic: bool = True
+    ) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        Get image as a cached file path, or as processed bytes on a cache miss
+        
+        On a miss the bytes are returned right away and written to the cache
+        in the background, so the caller can send the image without waiting
+        for the disk write.
+        
+        Args:
+            url: Image URL
+            use_cache: Whether to use cache
+            apply_mosaic: Whether to apply mosaic effect
+            
+        Returns:
+            Tuple of (cached_file_path, image_bytes); at most one is set
+        """
+        if use_cache:
+            cached_path = self._check_cache(url)
+            if cached_path:
+                return cached_path, None
+        
+        key, cached_path, image_bytes = await self._fetch_processed(url, apply_mosaic)
+        if cached_path:
+            return cached_path, None
+        if not image_bytes:
+            return None, None
+        
+        if self._cache_dir:
+            task = asyncio.create_task(self._store(url, key, image_bytes))
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+        
+        return None, image_bytes
     
     def cleanup_cache(self, max_files: int = 100) -> int:
         """
-        Clean up old cached files
+        Clean up least recently used cached files
         
         Args:
             max_files: Maximum number of files to keep
@@ -227,23 +768,63 @@ class ImageProcessor:
         Returns:
             Number of files deleted
         """
-        if not self._cache_dir or not self._cache_dir.exists():
+        if not self._cache_dir:
             return 0
         
-        # Get all cache files sorted by modification time
-        files = list(self._cache_dir.glob("*.jpg"))
-        files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        evicted = []
+        while len(self._index) > max(0, max_files):
+            evicted.append(self._pop_lru())
         
-        # Delete old files
-        deleted = 0
-        for file in files[max_files:]:
-            try:
-                file.unlink()
-                deleted += 1
-            except Exception:
-                pass
+        return self._unlink_all(evicted)
+    
+    async def sweep_cache(self) -> int:
+        """
+        Reconcile the LRU index with the cache directory and enforce bounds
+        
+        Entries whose files vanished from disk are dropped from the index,
+        stray files the index does not know about are deleted (files still
+        being written by _store are left alone), and the LRU
+        bounds are re-applied. Directory scans and deletions run in a worker
+        thread; the index itself is only touched on the event loop.
         
-        return deleted
+        Returns:
+            Number of files deleted
+        """
+        if not self._cache_dir:
+            return 0
+        
+        started = time.time()
+        on_disk = await asyncio.to_thread(self._scan_cache_names)
+        
+        # Entries added after the scan started may not be on the listing yet
+        for key in [k for k, (path, _, mtime) in self._index.items()
+                    if mtime < started and path.name not in on_disk]:
+            _, size, _ = self._index.pop(key)
+            self._cache_bytes -= size
+        
+        stale = []
+        for name in on_disk:
+            if name in self._writing:
+                continue
+            entry = self._index.get(name.rpartition(".")[0])
+            if entry is None or entry[0].name != name:
+                stale.append(self._cache_dir / name)
+        stale.extend(self._pop_over_limit())
+        
+        # Forget URL links to files that are no longer cached
+        self._url_keys = {u: k for u, k in self._url_keys.items() if k in self._index}
+        
+        if not stale:
+            return 0
+        return await asyncio.to_thread(self._unlink_all, stale)
+    
+    def _scan_cache_names(self) -> Set[str]:
+        """List cached image file names currently present in the cache directory"""
+        try:
+            with os.scandir(self._cache_dir) as it:
+                return {entry.name for entry in it if entry.name.endswith(CACHE_SUFFIXES)}
+        except OSError:
+            return set()
     
     def clear_cache(self) -> int:
         """
@@ -256,11 +837,12 @@ class ImageProcessor:
             return 0
         
         deleted = 0
-        for file in self._cache_dir.glob("*.jpg"):
-            try:
-                file.unlink()
-                deleted += 1
-            except Exception:
-                pass
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(CACHE_SUFFIXES) and self._unlink(entry.path):
+                    deleted += 1
         
+        self._index.clear()
+        self._url_keys.clear()
+        self._cache_bytes = 0
         return deleted
\ No newline at end of file
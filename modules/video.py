@@ -6,34 +6,118 @@ Handles video information extraction and parsing
 import re
 import json
 import html
-from typing import Optional, List, Dict, Any
-from functools import cached_property
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from typing import Optional, List, Dict, Any, Union
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, stdlib json is used
+    orjson = None
 
 from .consts import (
-    ROOT_URL, VIDEO_URL,
-    REGEX_VIDEO_ID, REGEX_VIDEO_ID_ALT,
-    REGEX_VIDEO_TITLE, REGEX_VIDEO_TITLE_ALT,
-    REGEX_VIDEO_DURATION, REGEX_VIDEO_DURATION_ALT,
-    REGEX_VIDEO_VIEWS, REGEX_VIDEO_VIEWS_ALT,
-    REGEX_VIDEO_RATING, REGEX_VIDEO_LIKES, REGEX_VIDEO_DISLIKES,
-    REGEX_VIDEO_UPLOADER, REGEX_VIDEO_UPLOAD_DATE,
-    REGEX_VIDEO_CATEGORIES, REGEX_VIDEO_TAGS,
-    REGEX_VIDEO_THUMBNAIL, REGEX_VIDEO_THUMBNAIL_ALT, REGEX_VIDEO_PREVIEW,
-    REGEX_VIDEO_SOURCE, REGEX_VIDEO_SOURCE_ALT,
-    REGEX_JSON_LD
+    ROOT_URL, VIDEO_URL, REGEX_SLUG_TRAILING_ID, HTML_BYTES_PARSER, absolute_url,
+    FIELD_PATTERN_NAMES, get_pattern, get_fields_pattern, may_match
 )
 from .errors import (
     InvalidURL, VideoNotFound, VideoDisabled, ParseError, InvalidVideoID
 )
 
 
+def _loads_json(text: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when available
+    
+    orjson is stricter than the stdlib parser (e.g. it rejects NaN), so
+    anything it refuses is retried with json before giving up.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+class _lazy:
+    """Compute-once attribute for slotted classes: the value is stored in the
+    instance slot named after the property plus a trailing underscore."""
+    
+    __slots__ = ("fn", "slot")
+    
+    def __init__(self, fn):
+        self.fn = fn
+        self.slot = fn.__name__ + "_"
+    
+    def __get__(self, inst, owner=None):
+        if inst is None:
+            return self
+        try:
+            return getattr(inst, self.slot)
+        except AttributeError:
+            value = self.fn(inst)
+            setattr(inst, self.slot, value)
+            return value
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode a value captured from the raw page and unescape its HTML entities"""
+    return html.unescape(raw.decode("utf-8", "replace"))
+
+
+def _unique_texts(matches: List[bytes]) -> List[str]:
+    """Decode captured names in page order, skipping repeats before decoding them"""
+    # Raw duplicates are dropped first. Names are stripped after unescaping
+    # (&nbsp; only becomes whitespace then), and the second pass merges
+    # spellings that only differ by entities ("&amp;"/"&", "&nbsp;Foo"/"Foo")
+    texts = (_decode_text(raw).strip() for raw in dict.fromkeys(matches))
+    return list(dict.fromkeys(text for text in texts if text))
+
+
+def _unescape_text(value: Any) -> Any:
+    """Unescape HTML entities in an extracted string, passing other values through"""
+    return html.unescape(value) if isinstance(value, str) else value
+
+
+# Thumbnail fallbacks, compiled once (first match in document order)
+_XP_OG_IMAGE = etree.XPath('(//meta[@property="og:image"])[1]')
+_XP_TWITTER_IMAGE = etree.XPath('(//meta[@name="twitter:image"])[1]')
+_XP_FIRST_VIDEO = etree.XPath('(//video)[1]')
+_XP_CLASSED_DIVS = etree.XPath('//div[@class]')
+_XP_FIRST_IMG = etree.XPath('(.//img)[1]')
+_RE_PLAYER_CLASS = re.compile(r"player|video-container|video-wrapper", re.I)
+
+# Site suffix stripped from titles
+_RE_TITLE_SUFFIX = re.compile(r'\s*[-|–—]\s*(Free\s+)?(Porn\s+)?(Video\s+)?(at\s+)?XXXGFPORN.*$', re.IGNORECASE)
+_RE_LOOKS_LIKE_URL = re.compile(r'/|http', re.I)
+# Removed-video notices, matched case-insensitively without lowering the page
+_RE_VIDEO_REMOVED = re.compile(rb'video has been removed|video not found', re.I)
+
+# Thousands separators dropped before int() in views_count (incl. no-break space)
+_VIEWS_SEPARATORS = str.maketrans("", "", ", \xa0")
+_RE_ISO_DURATION = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?')
+
+# Last-resort thumbnail scan over the raw page: <img> tags and their attributes
+_RE_IMG_TAG = re.compile(rb'<img\b[^>]*>', re.I)
+_RE_TAG_ATTR = re.compile(rb'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_RE_IMG_SKIP_CLASS = re.compile(r'icon|logo|avatar|ad', re.I)
+_RE_THUMB_HINT = re.compile(r'thumb|poster|preview|player', re.I)
+
+
 class Video:
     """
     Video class for parsing and extracting video information from XXXGFPORN
     """
     
+    __slots__ = (
+        "_video_id", "_client", "_html_content", "_json_ld_data", "_dict_cache", "_custom_url",
+        # Storage for the _lazy properties
+        "_ld_", "_tree_", "_fields_", "title_", "duration_", "duration_seconds_", "views_", "views_count_",
+        "rating_", "likes_", "dislikes_", "uploader_", "upload_date_", "thumbnail_",
+        "preview_", "categories_", "tags_", "source_url_", "description_",
+    )
+    
     def __init__(self, video_id: str, client: Optional[Any] = None, url: Optional[str] = None):
         """
         Initialize Video object
@@ -45,9 +129,9 @@ class Video:
         """
         self._video_id = str(video_id).strip()
         self._client = client
-        self._html_content: Optional[str] = None
+        self._html_content: Optional[bytes] = None  # raw page; regexes run on bytes
         self._json_ld_data: Optional[Dict] = None
-        self._soup: Optional[BeautifulSoup] = None
+        self._dict_cache: Optional[Dict[str, Any]] = None
         self._custom_url = url  # Store custom URL if provided
         
         # Validate video ID - accept both numeric and slug formats
@@ -55,7 +139,7 @@ class Video:
             raise InvalidVideoID(f"Invalid video ID: {video_id}")
         
         # If video_id looks like a URL, try to extract the ID/slug
-        if '/' in self._video_id or 'http' in self._video_id.lower():
+        if _RE_LOOKS_LIKE_URL.search(self._video_id):
             extracted = self._extract_id_from_url(self._video_id)
             if extracted:
                 self._video_id = extracted
@@ -66,10 +150,10 @@ class Video:
     
     def _extract_id_from_url(self, url: str) -> Optional[str]:
         """Extract video ID from URL"""
-        match = REGEX_VIDEO_ID.search(url)
+        match = get_pattern("video_id").search(url)
         if match:
             return match.group(1)
-        match = REGEX_VIDEO_ID_ALT.search(url)
+        match = get_pattern("video_id_alt").search(url)
         if match:
             return match.group(1)
         return None
@@ -88,7 +172,7 @@ class Video:
             return vid
         
         # Try to extract numeric ID from end of slug (e.g., "some-title-12345" -> "12345")
-        match = re.search(r'-(\d+)$', vid)
+        match = REGEX_SLUG_TRAILING_ID.search(vid)
         if match:
             return match.group(1)
         
@@ -111,20 +195,15 @@ class Video:
         if self._client is None:
             raise ValueError("Client is required to fetch video content")
         
-        self._html_content = await self._client.fetch(self.url)
+        # Kept undecoded: only the captured values are decoded
+        self._html_content = await self._client.fetch_bytes(self.url)
         if not self._html_content:
             raise VideoNotFound(f"Video not found: {self._video_id}")
         
         # Check if video is disabled/removed
-        if "video has been removed" in self._html_content.lower() or \
-           "video not found" in self._html_content.lower() or \
-           "404" in self._html_content[:500]:
+        if b"404" in self._html_content[:500] or _RE_VIDEO_REMOVED.search(self._html_content):
             raise VideoDisabled(f"Video has been removed: {self._video_id}")
         
-        # Parse HTML
-        self._html_content = html.unescape(self._html_content)
-        self._soup = BeautifulSoup(self._html_content, 'lxml')
-        
         # Extract JSON-LD data
         self._extract_json_ld()
     
@@ -133,10 +212,13 @@ class Video:
         if not self._html_content:
             return
         
-        matches = REGEX_JSON_LD.findall(self._html_content)
-        for match in matches:
+        if not may_match("json_ld", self._html_content):
+            return
+        
+        # Blocks are matched lazily: scanning stops at the VideoObject
+        for match in get_pattern("json_ld", binary=True).finditer(self._html_content):
             try:
-                data = json.loads(match.strip())
+                data = _loads_json(match.group(1))  # both parsers skip surrounding whitespace
                 if isinstance(data, dict):
                     if data.get("@type") == "VideoObject" or "video" in str(data.get("@type", "")).lower():
                         self._json_ld_data = data
@@ -145,73 +227,138 @@ class Video:
                     if self._json_ld_data is None:
                         self._json_ld_data = {}
                     self._json_ld_data.update(data)
-            except json.JSONDecodeError:
+            except ValueError:  # JSONDecodeError, or UnicodeDecodeError for non-UTF-8 bytes
                 continue
     
-    def _search_patterns(self, patterns: List, content: Optional[str] = None) -> Optional[str]:
-        """Search multiple regex patterns and return first match"""
-        content = content or self._html_content
-        if not content:
+    @_lazy
+    def _ld(self) -> Dict[str, Any]:
+        """JSON-LD values the properties use, normalized once (missing -> None)"""
+        data = self._json_ld_data or {}
+        
+        views = data.get("interactionCount")
+        if not views:
+            statistics = data.get("interactionStatistic")
+            if isinstance(statistics, dict):
+                statistics = [statistics]
+            if isinstance(statistics, list):
+                views = next((stat.get("userInteractionCount") for stat in statistics
+                              if isinstance(stat, dict) and stat.get("userInteractionCount")), None)
+        
+        rating = data.get("aggregateRating")
+        author = data.get("author")
+        thumb = data.get("thumbnailUrl")
+        keywords = data.get("keywords")
+        if isinstance(keywords, str):
+            keywords = [tag.strip() for tag in html.unescape(keywords).split(",")]
+        elif isinstance(keywords, list):
+            keywords = [_unescape_text(tag) for tag in keywords]
+        else:
+            keywords = None
+        
+        return {
+            "name": _unescape_text(data.get("name")),
+            "duration": data.get("duration"),
+            "views": str(views) if views else None,
+            "rating": rating.get("ratingValue") if isinstance(rating, dict) else None,
+            "author_name": _unescape_text(author.get("name") if isinstance(author, dict) else author),
+            "upload_date": data.get("uploadDate") or data.get("datePublished"),
+            "thumbnail": thumb[0] if isinstance(thumb, list) and thumb else thumb,
+            "keywords": keywords,
+            "content_url": data.get("contentUrl"),
+            "description": _unescape_text(data.get("description")),
+        }
+    
+    @_lazy
+    def _tree(self) -> Optional[lxml.html.HtmlElement]:
+        """lxml tree of the page, built on first use"""
+        if not self._html_content:
             return None
+        try:
+            return lxml.html.document_fromstring(self._html_content, parser=HTML_BYTES_PARSER)
+        except (etree.ParserError, ValueError):
+            return None
+    
+    @_lazy
+    def _fields(self) -> Dict[str, str]:
+        """First match of every single-value field pattern, from one pass over the page"""
+        if not self._html_content:
+            return {}
+        
+        found: Dict[str, bytes] = {}
+        for match in get_fields_pattern(binary=True).finditer(self._html_content):
+            # Exactly one alternative (one capture group) took part in the match
+            index = next(i for i, group in enumerate(match.groups()) if group is not None)
+            found.setdefault(FIELD_PATTERN_NAMES[index], match.group(index + 1))
+            if len(found) == len(FIELD_PATTERN_NAMES):
+                break
+        return {name: _decode_text(raw).strip() for name, raw in found.items()}
+    
+    def _search_patterns(self, names: List[str]) -> Optional[str]:
+        """
+        Return the first of the named fields found on the page
         
-        for pattern in patterns:
-            match = pattern.search(content)
-            if match:
-                return match.group(1).strip()
+        Names in consts.FIELD_PATTERN_NAMES come from the shared one-pass
+        scan; any other pattern is searched over the page on its own.
+        """
+        for name in names:
+            if name in FIELD_PATTERN_NAMES:
+                value = self._fields.get(name)
+            else:
+                value = self._search_pattern(name)
+            if value is not None:
+                return value
         return None
     
-    @cached_property
+    def _search_pattern(self, name: str) -> Optional[str]:
+        """Search one named pattern over the page and return its decoded capture"""
+        content = self._html_content
+        if not content or not may_match(name, content):
+            return None
+        match = get_pattern(name, binary=True).search(content)
+        return _decode_text(match.group(1)).strip() if match else None
+    
+    @_lazy
     def title(self) -> Optional[str]:
         """Get video title"""
         if not self._html_content:
             return None
         
-        result = None
-        
         # Try JSON-LD first
-        if self._json_ld_data and "name" in self._json_ld_data:
-            result = self._json_ld_data["name"]
+        result = self._ld["name"]
         
         # Try regex patterns
         if not result:
-            result = self._search_patterns([REGEX_VIDEO_TITLE, REGEX_VIDEO_TITLE_ALT])
+            result = self._search_patterns(["title", "title_alt"])
         
         if result:
             # Clean up title - remove website suffix
-            result = re.sub(r'\s*[-|–—]\s*(Free\s+)?(Porn\s+)?(Video\s+)?(at\s+)?XXXGFPORN.*$', '', result, flags=re.IGNORECASE)
+            result = _RE_TITLE_SUFFIX.sub('', result)
             result = result.strip()
         
         return result
     
-    @cached_property
+    @_lazy
     def duration(self) -> Optional[str]:
         """Get video duration (format: MM:SS or HH:MM:SS)"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data and "duration" in self._json_ld_data:
-            duration = self._json_ld_data["duration"]
-            # Convert ISO 8601 duration to HH:MM:SS
-            if duration.startswith("PT"):
-                duration = duration[2:]
-                hours = minutes = seconds = 0
-                if "H" in duration:
-                    hours, duration = duration.split("H")
-                    hours = int(hours)
-                if "M" in duration:
-                    minutes, duration = duration.split("M")
-                    minutes = int(minutes)
-                if "S" in duration:
-                    seconds = duration.replace("S", "")
-                    seconds = int(float(seconds))
-                if hours > 0:
-                    return f"{hours}:{minutes:02d}:{seconds:02d}"
-                return f"{minutes}:{seconds:02d}"
-        
-        return self._search_patterns([REGEX_VIDEO_DURATION, REGEX_VIDEO_DURATION_ALT])
-    
-    @cached_property
+        duration = self._ld["duration"]
+        # Convert ISO 8601 duration to HH:MM:SS
+        match = _RE_ISO_DURATION.fullmatch(duration) if isinstance(duration, str) else None
+        if match:
+            hours, minutes, seconds = match.groups()
+            hours = int(hours or 0)
+            minutes = int(minutes or 0)
+            seconds = int(float(seconds or 0))
+            if hours > 0:
+                return f"{hours}:{minutes:02d}:{seconds:02d}"
+            return f"{minutes}:{seconds:02d}"
+        
+        return self._search_patterns(["duration", "duration_alt"])
+    
+    @_lazy
     def duration_seconds(self) -> Optional[int]:
         """Get video duration in seconds"""
         duration = self.duration
@@ -219,228 +366,197 @@ class Video:
             return None
         
         parts = duration.split(":")
+        if len(parts) not in (2, 3):
+            return None
+        # MM:SS or HH:MM:SS, folded base-60
+        total = 0
         try:
-            if len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            elif len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
+            for part in parts:
+                total = total * 60 + int(part)
         except ValueError:
             return None
-        return None
+        return total
     
-    @cached_property
+    @_lazy
     def views(self) -> Optional[str]:
         """Get view count as string"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            views = self._json_ld_data.get("interactionCount") or \
-                    self._json_ld_data.get("interactionStatistic", {}).get("userInteractionCount")
-            if views:
-                return str(views)
+        if self._ld["views"]:
+            return self._ld["views"]
         
-        return self._search_patterns([REGEX_VIDEO_VIEWS, REGEX_VIDEO_VIEWS_ALT])
+        return self._search_patterns(["views", "views_alt"])
     
-    @cached_property
+    @_lazy
     def views_count(self) -> Optional[int]:
         """Get view count as integer"""
         views = self.views
         if not views:
             return None
         try:
-            return int(views.replace(",", "").replace(" ", ""))
+            return int(views.translate(_VIEWS_SEPARATORS))
         except ValueError:
             return None
     
-    @cached_property
+    @_lazy
     def rating(self) -> Optional[str]:
         """Get video rating percentage"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            rating = self._json_ld_data.get("aggregateRating", {}).get("ratingValue")
-            if rating:
-                return f"{rating}%"
+        rating = self._ld["rating"]
+        if rating:
+            return f"{rating}%"
         
-        return self._search_patterns([REGEX_VIDEO_RATING])
+        return self._search_patterns(["rating"])
     
-    @cached_property
+    @_lazy
     def likes(self) -> Optional[str]:
         """Get like count"""
-        return self._search_patterns([REGEX_VIDEO_LIKES])
+        return self._search_patterns(["likes"])
     
-    @cached_property
+    @_lazy
     def dislikes(self) -> Optional[str]:
         """Get dislike count"""
-        return self._search_patterns([REGEX_VIDEO_DISLIKES])
+        return self._search_patterns(["dislikes"])
     
-    @cached_property
+    @_lazy
     def uploader(self) -> Optional[str]:
         """Get uploader name"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            author = self._json_ld_data.get("author")
-            if isinstance(author, dict):
-                return author.get("name")
-            elif isinstance(author, str):
-                return author
+        if self._ld["author_name"]:
+            return self._ld["author_name"]
         
-        return self._search_patterns([REGEX_VIDEO_UPLOADER])
+        return self._search_patterns(["uploader"])
     
-    @cached_property
+    @_lazy
     def upload_date(self) -> Optional[str]:
         """Get upload date"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            date = self._json_ld_data.get("uploadDate") or self._json_ld_data.get("datePublished")
-            if date:
-                return date
+        if self._ld["upload_date"]:
+            return self._ld["upload_date"]
         
-        return self._search_patterns([REGEX_VIDEO_UPLOAD_DATE])
+        return self._search_patterns(["upload_date"])
     
-    @cached_property
+    @_lazy
     def thumbnail(self) -> Optional[str]:
         """Get thumbnail URL"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            thumb = self._json_ld_data.get("thumbnailUrl")
-            if isinstance(thumb, list) and thumb:
-                return thumb[0]
-            elif isinstance(thumb, str):
-                return thumb
+        if self._ld["thumbnail"]:
+            return self._ld["thumbnail"]
         
         # Try regex patterns
-        result = self._search_patterns([REGEX_VIDEO_THUMBNAIL, REGEX_VIDEO_THUMBNAIL_ALT])
+        result = self._search_patterns(["thumbnail", "thumbnail_alt"])
         if result:
-            if not result.startswith("http"):
-                result = urljoin(ROOT_URL, result)
-            return result
-        
-        # Try og:image meta tag (common fallback)
-        if self._soup:
-            og_image = self._soup.find("meta", property="og:image")
-            if og_image and og_image.get("content"):
-                return og_image.get("content")
-            
-            # Try twitter:image meta tag
-            twitter_image = self._soup.find("meta", attrs={"name": "twitter:image"})
-            if twitter_image and twitter_image.get("content"):
-                return twitter_image.get("content")
+            return absolute_url(result)
+        
+        # Try og:image, then twitter:image meta tags (common fallback)
+        tree = self._tree
+        if tree is not None:
+            for xpath in (_XP_OG_IMAGE, _XP_TWITTER_IMAGE):
+                meta = xpath(tree)
+                if meta and meta[0].get("content"):
+                    return meta[0].get("content")
             
             # Try video poster attribute
-            video_tag = self._soup.find("video")
-            if video_tag and video_tag.get("poster"):
-                poster = video_tag.get("poster")
-                if not poster.startswith("http"):
-                    poster = urljoin(ROOT_URL, poster)
-                return poster
+            video_tag = _XP_FIRST_VIDEO(tree)
+            if video_tag and video_tag[0].get("poster"):
+                return absolute_url(video_tag[0].get("poster"))
             
             # Try finding image in player area
-            player_div = self._soup.find("div", class_=re.compile(r"player|video-container|video-wrapper", re.I))
-            if player_div:
-                img = player_div.find("img")
+            player_div = next((div for div in _XP_CLASSED_DIVS(tree)
+                               if _RE_PLAYER_CLASS.search(div.get("class"))), None)
+            if player_div is not None:
+                img = _XP_FIRST_IMG(player_div)
                 if img:
-                    src = img.get("data-src") or img.get("src")
+                    src = img[0].get("data-src") or img[0].get("src")
                     if src and not src.startswith("data:"):
-                        if not src.startswith("http"):
-                            src = urljoin(ROOT_URL, src)
-                        return src
-            
-            # Try finding any large image (likely thumbnail)
-            for img in self._soup.find_all("img"):
-                src = img.get("data-src") or img.get("src")
-                if not src or src.startswith("data:"):
-                    continue
-                # Skip small icons and logos
-                classes = img.get("class", [])
-                if isinstance(classes, list):
-                    classes_str = " ".join(classes)
-                else:
-                    classes_str = str(classes)
-                if any(x in classes_str.lower() for x in ["icon", "logo", "avatar", "ad"]):
-                    continue
-                # Check for common thumbnail indicators
-                if any(x in src.lower() for x in ["thumb", "poster", "preview", "player"]):
-                    if not src.startswith("http"):
-                        src = urljoin(ROOT_URL, src)
-                    return src
+                        return absolute_url(src)
         
+        # Try finding any large image (likely thumbnail)
+        return self._scan_img_thumbnail()
+    
+    def _scan_img_thumbnail(self) -> Optional[str]:
+        """Return the first <img> whose src looks like a thumbnail, scanning the raw HTML"""
+        if not self._html_content:
+            return None
+        for tag in _RE_IMG_TAG.finditer(self._html_content):
+            attrs: Dict[str, str] = {}
+            for attr in _RE_TAG_ATTR.finditer(tag.group()):
+                value = attr.group(2) if attr.group(2) is not None else attr.group(3)
+                attrs.setdefault(attr.group(1).lower().decode(), _decode_text(value))
+            src = attrs.get("data-src") or attrs.get("src")
+            if not src or src.startswith("data:"):
+                continue
+            # Skip small icons and logos
+            if _RE_IMG_SKIP_CLASS.search(attrs.get("class", "")):
+                continue
+            # Check for common thumbnail indicators
+            if _RE_THUMB_HINT.search(src):
+                return absolute_url(src)
         return None
     
-    @cached_property
+    @_lazy
     def preview(self) -> Optional[str]:
         """Get video preview URL (animated/gif)"""
-        result = self._search_patterns([REGEX_VIDEO_PREVIEW])
-        if result and not result.startswith("http"):
-            result = urljoin(ROOT_URL, result)
-        return result
+        result = self._search_patterns(["preview"])
+        return absolute_url(result) if result else result
     
-    @cached_property
+    @_lazy
     def categories(self) -> List[str]:
         """Get video categories"""
         if not self._html_content:
             return []
         
-        matches = REGEX_VIDEO_CATEGORIES.findall(self._html_content)
-        return list(set(cat.strip() for cat in matches if cat.strip()))
+        return _unique_texts(get_pattern("categories", binary=True).findall(self._html_content))
     
-    @cached_property
+    @_lazy
     def tags(self) -> List[str]:
         """Get video tags"""
         if not self._html_content:
             return []
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            keywords = self._json_ld_data.get("keywords")
-            if isinstance(keywords, str):
-                return [tag.strip() for tag in keywords.split(",")]
-            elif isinstance(keywords, list):
-                return keywords
+        if self._ld["keywords"] is not None:
+            return self._ld["keywords"]
         
-        matches = REGEX_VIDEO_TAGS.findall(self._html_content)
-        return list(set(tag.strip() for tag in matches if tag.strip()))
+        return _unique_texts(get_pattern("tags", binary=True).findall(self._html_content))
     
-    @cached_property
+    @_lazy
     def source_url(self) -> Optional[str]:
         """Get direct video source URL"""
         if not self._html_content:
             return None
         
         # Try JSON-LD first
-        if self._json_ld_data:
-            content_url = self._json_ld_data.get("contentUrl")
-            if content_url:
-                return content_url
-        
-        result = self._search_patterns([REGEX_VIDEO_SOURCE, REGEX_VIDEO_SOURCE_ALT])
-        if result and not result.startswith("http"):
-            result = urljoin(ROOT_URL, result)
-        return result
+        if self._ld["content_url"]:
+            return self._ld["content_url"]
+        
+        result = self._search_patterns(["source", "source_alt"])
+        return absolute_url(result) if result else result
     
-    @cached_property
+    @_lazy
     def description(self) -> Optional[str]:
         """Get video description"""
-        if self._json_ld_data:
-            return self._json_ld_data.get("description")
-        return None
+        return self._ld["description"]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert video info to dictionary"""
-        return {
+        """Convert video info to dictionary (built once, then reused)"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "video_id": self.video_id,
             "url": self.url,
             "title": self.title,
@@ -460,6 +576,7 @@ class Video:
             "source_url": self.source_url,
             "description": self.description,
         }
+        return self._dict_cache
     
     def __repr__(self) -> str:
         return f"Video(id={self.video_id}, title={self.title})"
@@ -0,0 +1,25 @@
+"""Regression cases for Video page parsing (no network: pages are set directly)"""
+
+from modules.video import Video
+
+
+def _video(page: str) -> Video:
+    video = Video("9")
+    video._html_content = page.encode()
+    return video
+
+
+def test_preview_inside_thumbnail_img():
+    # data-preview before src: the thumbnail match spans the whole tag
+    video = _video('<img class="thumb" data-preview="/prev/9.mp4" src="/t/9.jpg">')
+    assert video.preview == "https://www.xxxgfporn.com/prev/9.mp4"
+    assert video.thumbnail == "https://www.xxxgfporn.com/t/9.jpg"
+
+
+def test_categories_strip_entities_and_dedupe():
+    video = _video(
+        '<a href="/categories/x/">&nbsp;Foo&nbsp;</a>'
+        '<a href="/categories/y/">Foo</a>'
+        '<a href="/categories/z/">&nbsp;</a>'
+    )
+    assert video.categories == ["Foo"]